@@ -19,10 +19,45 @@ depends_on: Union[str, Sequence[str], None] = None
 # Import password hashing
 from passlib.context import CryptContext
 
+# Build the context once, with the same argon2id parameters as app.core.security
+_PWD_CTX = CryptContext(
+    schemes=["argon2"],
+    argon2__type="ID",
+    argon2__memory_cost=46 * 1024,
+    argon2__rounds=3,
+    argon2__parallelism=1,
+)
+
+# Built once so every row of the executemany reuses the same compiled statement
+_INSERT_WORD = sa.text("""
+    INSERT INTO words (id, text, jyutping, deck_id, created_at)
+    VALUES (gen_random_uuid(), :text, :jyutping, :deck_id, CURRENT_TIMESTAMP)
+""").bindparams(
+    sa.bindparam("text", type_=sa.Unicode),
+    sa.bindparam("jyutping", type_=sa.Unicode),
+    sa.bindparam("deck_id", type_=sa.String),
+)
+
+# Demo deck vocabulary as (text, jyutping) pairs
+_DEMO_WORDS = (
+    ("一", "jat1"), ("二", "ji6"), ("三", "saam1"), ("四", "sei3"), ("五", "ng5"),
+    ("六", "luk6"), ("七", "cat1"), ("八", "baat3"), ("九", "gau2"), ("十", "sap6"),
+    ("媽媽", "maa4 maa1"), ("爸爸", "baa4 baa1"), ("哥哥", "go4 go1"), ("姐姐", "ze2 ze2"),
+    ("弟弟", "dai6 dai6"), ("妹妹", "mui6 mui2"), ("你好", "nei5 hou2"), ("早晨", "zou2 san4"),
+    ("再見", "zoi3 gin3"), ("學校", "hok6 haau6"), ("老師", "lou5 si1"), ("同學", "tung4 hok6"),
+    ("朋友", "pang4 jau5"), ("食飯", "sik6 faan6"), ("飲水", "jam2 seoi2"), ("瞓覺", "fan3 gaau3"),
+    ("玩耍", "waan2 so2"), ("讀書", "duk6 syu1"), ("寫字", "se2 zi6"), ("大", "daai6"),
+    ("細", "sai3"), ("多", "do1"), ("少", "siu2"), ("好", "hou2"), ("美麗", "mei5 lai6"),
+    ("聰明", "sing1 ming4"), ("開心", "hoi1 sam1"), ("快樂", "faai3 lok6"), ("紅色", "hung4 sik1"),
+    ("藍色", "lam4 sik1"), ("綠色", "luk6 sik1"), ("白色", "baak6 sik1"), ("黑色", "hak1 sik1"),
+    ("貓", "maau1"), ("狗", "gau2"), ("雞", "gai1"), ("鴨", "aap3"), ("牛", "ngau4"),
+    ("魚", "jyu4"), ("鳥", "niu5"), ("花", "faa1"), ("草", "chou2"), ("樹", "syu6"),
+    ("屋企", "uk1 kei2"), ("學生", "hok6 sang1"), ("書包", "syu1 baau1"), ("鉛筆", "aa1 bat1")
+)
+
 def hash_password(password: str) -> str:
     """Hash a password for storage."""
-    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-    return pwd_context.hash(password)
+    return _PWD_CTX.hash(password)
 
 def upgrade() -> None:
     # Get database connection
@@ -53,49 +88,29 @@ def upgrade() -> None:
         {"id": deck_id, "name": "Grade 1 - Basic Words", "description": "Simple Cantonese words for Grade 1 students"}
     )
 
-    # Add words to deck
-    words = [
-        ("一", "jat1"), ("二", "ji6"), ("三", "saam1"), ("四", "sei3"), ("五", "ng5"),
-        ("六", "luk6"), ("七", "cat1"), ("八", "baat3"), ("九", "gau2"), ("十", "sap6"),
-        ("媽媽", "maa4 maa1"), ("爸爸", "baa4 baa1"), ("哥哥", "go4 go1"), ("姐姐", "ze2 ze2"),
-        ("弟弟", "dai6 dai6"), ("妹妹", "mui6 mui2"), ("你好", "nei5 hou2"), ("早晨", "zou2 san4"),
-        ("再見", "zoi3 gin3"), ("學校", "hok6 haau6"), ("老師", "lou5 si1"), ("同學", "tung4 hok6"),
-        ("朋友", "pang4 jau5"), ("食飯", "sik6 faan6"), ("飲水", "jam2 seoi2"), ("瞓覺", "fan3 gaau3"),
-        ("玩耍", "waan2 so2"), ("讀書", "duk6 syu1"), ("寫字", "se2 zi6"), ("大", "daai6"),
-        ("細", "sai3"), ("多", "do1"), ("少", "siu2"), ("好", "hou2"), ("美麗", "mei5 lai6"),
-        ("聰明", "sing1 ming4"), ("開心", "hoi1 sam1"), ("快樂", "faai3 lok6"), ("紅色", "hung4 sik1"),
-        ("藍色", "lam4 sik1"), ("綠色", "luk6 sik1"), ("白色", "baak6 sik1"), ("黑色", "hak1 sik1"),
-        ("貓", "maau1"), ("狗", "gau2"), ("雞", "gai1"), ("鴨", "aap3"), ("牛", "ngau4"),
-        ("魚", "jyu4"), ("鳥", "niu5"), ("花", "faa1"), ("草", "chou2"), ("樹", "syu6"),
-        ("屋企", "uk1 kei2"), ("學生", "hok6 sang1"), ("書包", "syu1 baau1"), ("鉛筆", "aa1 bat1")
-    ]
-
-    for word_text, word_jyutping in words:
-        conn.execute(
-            sa.text("""
-                INSERT INTO words (id, text, jyutping, deck_id, created_at)
-                VALUES (gen_random_uuid(), :text, :jyutping, :deck_id, CURRENT_TIMESTAMP)
-            """),
+    # Insert all words in a single executemany call instead of one round-trip per word
+    conn.execute(
+        _INSERT_WORD,
+        [
             {"text": word_text, "jyutping": word_jyutping, "deck_id": deck_id}
-        )
+            for word_text, word_jyutping in _DEMO_WORDS
+        ]
+    )
 
 def downgrade() -> None:
     conn = op.get_bind()
 
-    # Delete words from demo deck
-    conn.execute(
-        sa.text("DELETE FROM words WHERE deck_id = :deck_id"),
-        {"deck_id": "00000000-0000-0000-0000-000000000002"}
-    )
-
-    # Delete demo deck
+    # Delete the demo deck's words, the demo deck and the admin user in one
+    # statement (words.deck_id has no ON DELETE CASCADE, so words go explicitly).
+    # The FK check runs at the end of the statement, after both deletes.
     conn.execute(
-        sa.text("DELETE FROM decks WHERE id = :deck_id"),
-        {"deck_id": "00000000-0000-0000-0000-000000000002"}
-    )
-
-    # Delete admin user
-    conn.execute(
-        sa.text("DELETE FROM users WHERE username = :username"),
-        {"username": "admin"}
+        sa.text("""
+            WITH deleted_words AS (
+                DELETE FROM words WHERE deck_id = :deck_id
+            ), deleted_deck AS (
+                DELETE FROM decks WHERE id = :deck_id
+            )
+            DELETE FROM users WHERE username = :username
+        """),
+        {"deck_id": "00000000-0000-0000-0000-000000000002", "username": "admin"}
     )
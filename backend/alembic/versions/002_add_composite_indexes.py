@@ -0,0 +1,26 @@
+"""Add composite indexes for attempt and session lookups
+
+Revision ID: c7d4e9a1b2f3
+Revises: a3f5b8c2d9e1
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7d4e9a1b2f3'
+down_revision: Union[str, None] = 'a3f5b8c2d9e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_attempt_session_word', 'game_attempts', ['session_id', 'word_id'], unique=True)
+    op.create_index('ix_gs_user_deck', 'game_sessions', ['user_id', 'deck_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_gs_user_deck', table_name='game_sessions')
+    op.drop_index('ix_attempt_session_word', table_name='game_attempts')
@@ -0,0 +1,24 @@
+"""Index users by role
+
+Revision ID: e1b6f0a4c8d2
+Revises: c7d4e9a1b2f3
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1b6f0a4c8d2'
+down_revision: Union[str, None] = 'c7d4e9a1b2f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_users_role', 'users', ['role'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_role', table_name='users')
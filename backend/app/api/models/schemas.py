@@ -11,7 +11,7 @@ class User(BaseModel):
     role: str
     createdAt: datetime = Field(alias="created_at")
     
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
 
 
 # Deck schemas
@@ -19,10 +19,10 @@ class Deck(BaseModel):
     id: UUID
     name: str
     description: Optional[str] = None
-    createdAt: datetime
-    wordCount: int = 0
+    createdAt: datetime = Field(validation_alias="created_at")
+    wordCount: int = Field(default=0, validation_alias="word_count")
     
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
 
 
 class CreateDeckRequest(BaseModel):
@@ -35,10 +35,10 @@ class Word(BaseModel):
     id: UUID
     text: str
     jyutping: str
-    deckId: UUID
-    createdAt: datetime
+    deckId: UUID = Field(validation_alias="deck_id")
+    createdAt: datetime = Field(validation_alias="created_at")
     
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
 
 
 class CreateWordRequest(BaseModel):
@@ -57,14 +57,14 @@ class GameWord(BaseModel):
 
 class GameSession(BaseModel):
     id: UUID
-    userId: UUID
-    deckId: UUID
+    userId: UUID = Field(validation_alias="user_id")
+    deckId: UUID = Field(validation_alias="deck_id")
     words: List[GameWord]
     score: Optional[int] = None
-    startedAt: datetime
-    endedAt: Optional[datetime] = None
+    startedAt: datetime = Field(validation_alias="started_at")
+    endedAt: Optional[datetime] = Field(default=None, validation_alias="ended_at")
     
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
 
 
 class StartGameRequest(BaseModel):
@@ -146,8 +146,10 @@ class AssociationRequest(BaseModel):
 
 
 class Association(BaseModel):
-    studentId: UUID
-    teacherId: UUID
+    studentId: UUID = Field(validation_alias="student_id")
+    teacherId: UUID = Field(validation_alias="teacher_id")
+    
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
 
 
 class ResetPasswordRequest(BaseModel):
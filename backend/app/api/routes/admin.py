@@ -1,11 +1,12 @@
-from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi import APIRouter, HTTPException, status, Depends, Response
 from uuid import UUID
 from typing import List
 from app.api.models.schemas import (
     Deck, Word, CreateDeckRequest, CreateWordRequest,
     AssociationRequest, Association, ResetPasswordRequest
 )
-from app.core.dependencies import get_current_admin, get_db_service
+from app.core.dependencies import get_current_admin, get_db_service, invalidate_cached_user
+from app.services.statistics_service import invalidate_statistics_cache
 from app.db.database_service import DatabaseService
 from app.engines.jyutping_engine import jyutping_engine
 
@@ -13,24 +14,18 @@ router = APIRouter(prefix="/admin", tags=["Admin"])
 
 
 @router.post("/decks", response_model=Deck, status_code=status.HTTP_201_CREATED)
-async def create_deck(
+def create_deck(
     request: CreateDeckRequest,
     current_user: dict = Depends(get_current_admin),
     db_service: DatabaseService = Depends(get_db_service)
 ):
     """Create a new deck."""
     deck = db_service.create_deck(request.name, request.description)
-    return Deck(
-        id=deck["id"],
-        name=deck["name"],
-        description=deck.get("description"),
-        createdAt=deck["created_at"],
-        wordCount=deck.get("word_count", 0),
-    )
+    return Deck.model_validate(deck)
 
 
-@router.delete("/decks/{deck_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_deck(
+@router.delete("/decks/{deck_id}", response_model=None, response_class=Response, status_code=status.HTTP_204_NO_CONTENT)
+def delete_deck(
     deck_id: UUID,
     current_user: dict = Depends(get_current_admin),
     db_service: DatabaseService = Depends(get_db_service)
@@ -41,10 +36,13 @@ async def delete_deck(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Deck not found"
         )
+    # Cached error ratios may reference the removed words
+    invalidate_statistics_cache()
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
 @router.post("/decks/{deck_id}/words", response_model=Word, status_code=status.HTTP_201_CREATED)
-async def add_word(
+def add_word(
     deck_id: UUID,
     request: CreateWordRequest,
     current_user: dict = Depends(get_current_admin),
@@ -58,7 +56,6 @@ async def add_word(
             detail="Deck not found"
         )
     
-    # Generate jyutping
     jyutping = jyutping_engine.get_jyutping(request.text)
     if not jyutping:
         raise HTTPException(
@@ -67,17 +64,11 @@ async def add_word(
         )
     
     word = db_service.create_word(request.text, jyutping, deck_id)
-    return Word(
-        id=word["id"],
-        text=word["text"],
-        jyutping=word["jyutping"],
-        deckId=word["deck_id"],
-        createdAt=word["created_at"]
-    )
+    return Word.model_validate(word)
 
 
-@router.delete("/words/{word_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_word(
+@router.delete("/words/{word_id}", response_model=None, response_class=Response, status_code=status.HTTP_204_NO_CONTENT)
+def delete_word(
     word_id: UUID,
     current_user: dict = Depends(get_current_admin),
     db_service: DatabaseService = Depends(get_db_service)
@@ -88,17 +79,21 @@ async def delete_word(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Word not found"
         )
+    # Cached error ratios may reference the removed words
+    invalidate_statistics_cache()
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
-@router.post("/associations", status_code=status.HTTP_204_NO_CONTENT)
-async def create_association(
+@router.post("/associations", response_model=None, response_class=Response, status_code=status.HTTP_204_NO_CONTENT)
+def create_association(
     request: AssociationRequest,
     current_user: dict = Depends(get_current_admin),
     db_service: DatabaseService = Depends(get_db_service)
 ):
     """Associate a student with a teacher."""
-    student = db_service.get_user_by_id(request.studentId)
-    teacher = db_service.get_user_by_id(request.teacherId)
+    users = db_service.get_users_by_ids([request.studentId, request.teacherId])
+    student = users.get(request.studentId)
+    teacher = users.get(request.teacherId)
     
     if not student:
         raise HTTPException(
@@ -124,24 +119,25 @@ async def create_association(
             detail="User is not a teacher"
         )
     
+    # Both the previous and the new teacher's student lists change
+    previous_teacher_ids = db_service.get_teachers_by_student(request.studentId)
     db_service.create_association(request.studentId, request.teacherId)
+    invalidate_statistics_cache(request.studentId, [*previous_teacher_ids, request.teacherId])
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
 @router.get("/associations", response_model=List[Association], status_code=status.HTTP_200_OK)
-async def list_associations(
+def list_associations(
     current_user: dict = Depends(get_current_admin),
     db_service: DatabaseService = Depends(get_db_service)
 ):
     """List all student-teacher associations (admin only)."""
     associations = db_service.get_all_associations()
-    return [
-        Association(studentId=a["student_id"], teacherId=a["teacher_id"])
-        for a in associations
-    ]
+    return [Association.model_validate(a) for a in associations]
 
 
-@router.post("/users/{user_id}/reset-password", status_code=status.HTTP_204_NO_CONTENT)
-async def reset_password(
+@router.post("/users/{user_id}/reset-password", response_model=None, response_class=Response, status_code=status.HTTP_204_NO_CONTENT)
+def reset_password(
     user_id: UUID,
     request: ResetPasswordRequest,
     current_user: dict = Depends(get_current_admin),
@@ -153,4 +149,6 @@ async def reset_password(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
+    invalidate_cached_user(user_id)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
 
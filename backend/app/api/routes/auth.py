@@ -1,8 +1,8 @@
 from fastapi import APIRouter, HTTPException, status, Depends
+from starlette.concurrency import run_in_threadpool
 from app.api.models.schemas import LoginRequest, RegisterRequest, AuthResponse, ErrorResponse
 from app.services.auth_service import AuthService
-from app.core.dependencies import get_db_service
-from app.db.database_service import DatabaseService
+from app.core.dependencies import get_auth_service
 
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
@@ -11,11 +11,14 @@ router = APIRouter(prefix="/auth", tags=["Authentication"])
 @router.post("/login", response_model=AuthResponse, status_code=status.HTTP_200_OK)
 async def login(
     request: LoginRequest,
-    db_service: DatabaseService = Depends(get_db_service)
+    auth_service: AuthService = Depends(get_auth_service)
 ):
     """Login user and return JWT token."""
-    auth_service = AuthService(db_service)
-    user = auth_service.authenticate_user(request.username, request.password)
+    # Password verification (argon2/bcrypt) and the user lookup are blocking;
+    # run them in the threadpool so they don't stall the event loop
+    user = await run_in_threadpool(
+        auth_service.authenticate_user, request.username, request.password
+    )
     
     if not user:
         raise HTTPException(
@@ -29,12 +32,12 @@ async def login(
 @router.post("/register", response_model=AuthResponse, status_code=status.HTTP_201_CREATED)
 async def register(
     request: RegisterRequest,
-    db_service: DatabaseService = Depends(get_db_service)
+    auth_service: AuthService = Depends(get_auth_service)
 ):
     """Register a new user."""
-    auth_service = AuthService(db_service)
     try:
-        user = auth_service.create_user(
+        user = await run_in_threadpool(
+            auth_service.create_user,
             request.username,
             request.password,
             request.role
@@ -3,32 +3,34 @@ from uuid import UUID
 from typing import List
 from app.api.models.schemas import Deck, Word
 from app.core.dependencies import get_current_user, get_db_service
+from app.core.responses import ORJSONResponse
 from app.db.database_service import DatabaseService
 
 router = APIRouter(prefix="/decks", tags=["Decks"])
 
 
 @router.get("", response_model=List[Deck], status_code=status.HTTP_200_OK)
-async def get_decks(
+def get_decks(
     current_user: dict = Depends(get_current_user),
     db_service: DatabaseService = Depends(get_db_service)
 ):
     """Get all available decks."""
     decks = db_service.get_all_decks()
-    return [
-        Deck(
-            id=deck["id"],
-            name=deck["name"],
-            description=deck.get("description"),
-            createdAt=deck["created_at"],
-            wordCount=deck.get("word_count", 0),
-        )
+    # Serialize rows straight to JSON; response_model is kept for the OpenAPI docs
+    return ORJSONResponse([
+        {
+            "id": deck["id"],
+            "name": deck["name"],
+            "description": deck["description"],
+            "createdAt": deck["created_at"],
+            "wordCount": deck["word_count"],
+        }
         for deck in decks
-    ]
+    ])
 
 
 @router.get("/{deck_id}/words", response_model=List[Word], status_code=status.HTTP_200_OK)
-async def get_words_by_deck(
+def get_words_by_deck(
     deck_id: UUID,
     current_user: dict = Depends(get_current_user),
     db_service: DatabaseService = Depends(get_db_service)
@@ -42,14 +44,14 @@ async def get_words_by_deck(
         )
     
     words = db_service.get_words_by_deck(deck_id)
-    return [
-        Word(
-            id=word["id"],
-            text=word["text"],
-            jyutping=word["jyutping"],
-            deckId=word["deck_id"],
-            createdAt=word["created_at"]
-        )
+    return ORJSONResponse([
+        {
+            "id": word["id"],
+            "text": word["text"],
+            "jyutping": word["jyutping"],
+            "deckId": word["deck_id"],
+            "createdAt": word["created_at"],
+        }
         for word in words
-    ]
+    ])
 
@@ -1,23 +1,23 @@
 from fastapi import APIRouter, HTTPException, status, Depends, UploadFile, File, Form
+from starlette.concurrency import run_in_threadpool
 from typing import Optional
 from uuid import UUID
 from app.api.models.schemas import GameSession, StartGameRequest, PronunciationResponse
-from app.core.dependencies import get_current_user, get_db_service
+from app.core.debug_log import log_event as _log
+from app.core.dependencies import get_current_user, get_game_service
 from app.services.game_service import GameService
-from app.db.database_service import DatabaseService
 
 router = APIRouter(prefix="/games", tags=["Games"])
 
 
 @router.post("/start", response_model=GameSession, status_code=status.HTTP_201_CREATED)
-async def start_game(
+def start_game(
     request: StartGameRequest,
     current_user: dict = Depends(get_current_user),
-    db_service: DatabaseService = Depends(get_db_service)
+    game_service: GameService = Depends(get_game_service)
 ):
     """Start a new game session."""
     try:
-        game_service = GameService(db_service)
         return game_service.start_game(current_user["id"], request.deckId)
     except ValueError as e:
         raise HTTPException(
@@ -34,20 +34,20 @@ async def submit_pronunciation(
     audio: UploadFile = File(None),
     realTimeRecognition: Optional[str] = Form(None),
     current_user: dict = Depends(get_current_user),
-    db_service: DatabaseService = Depends(get_db_service)
+    game_service: GameService = Depends(get_game_service)
 ):
     """Submit pronunciation attempt."""
     try:
-        game_service = GameService(db_service)
-        audio_data = None
-        if audio:
-            audio_data = await audio.read()
+        # Hand the spooled upload file to the recognizer rather than reading it into memory
+        audio_file = audio.file if audio else None
         
-        is_correct, feedback, recognized_text, expected_text, expected_jyutping = game_service.submit_pronunciation(
+        # Recognition and DB writes are blocking; keep them off the event loop
+        is_correct, feedback, recognized_text, expected_text, expected_jyutping = await run_in_threadpool(
+            game_service.submit_pronunciation,
             sessionId,
             wordId,
             responseTime,
-            audio_data,
+            audio_file,
             real_time_recognition=realTimeRecognition
         )
         
@@ -61,7 +61,7 @@ async def submit_pronunciation(
     except ValueError as e:
         _log(
             "submit_pronunciation raised ValueError",
-            {"error": str(e)},
+            lambda: {"error": str(e), "sessionId": sessionId, "wordId": wordId},
             "games.py:submit_pronunciation:2",
             "ROUTE-GAME-B",
         )
@@ -72,14 +72,13 @@ async def submit_pronunciation(
 
 
 @router.post("/{session_id}/end", response_model=GameSession, status_code=status.HTTP_200_OK)
-async def end_game(
+def end_game(
     session_id: UUID,
     current_user: dict = Depends(get_current_user),
-    db_service: DatabaseService = Depends(get_db_service)
+    game_service: GameService = Depends(get_game_service)
 ):
     """End a game session and calculate final score."""
     try:
-        game_service = GameService(db_service)
         return game_service.end_game(session_id)
     except ValueError as e:
         raise HTTPException(
@@ -0,0 +1,93 @@
+"""
+Non-blocking NDJSON debug log.
+
+Route handlers call ``log_event``, which only puts a record on a bounded
+in-memory queue. A ``QueueListener`` thread, started in the application
+lifespan, drains the queue into a rotating file, so no file I/O ever happens
+on the event loop. Everything is a no-op unless ``settings.debug_log_enabled``.
+"""
+import logging
+import queue
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Any, Callable, Dict, Optional, Union
+
+import orjson
+
+from app.core.config import settings
+
+_LOG_QUEUE_MAXSIZE = 10000
+_LOG_MAX_BYTES = 10 * 1024 * 1024
+_LOG_BACKUP_COUNT = 3
+
+# Read once at import so the disabled path is a single global lookup
+_LOG_ENABLED = settings.debug_log_enabled
+
+
+class _DroppingQueueHandler(QueueHandler):
+    """Queue handler that drops records instead of blocking or erroring when full."""
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
+
+
+_log_queue: queue.Queue = queue.Queue(maxsize=_LOG_QUEUE_MAXSIZE)
+_listener: Optional[QueueListener] = None
+
+logger = logging.getLogger("app.debug")
+logger.setLevel(logging.INFO)
+logger.propagate = False
+logger.addHandler(_DroppingQueueHandler(_log_queue))
+
+
+def start_debug_log() -> None:
+    """Start the background writer thread (called from the app lifespan)."""
+    global _listener
+    if not _LOG_ENABLED or _listener is not None:
+        return
+    handler = RotatingFileHandler(
+        settings.debug_log_path,
+        maxBytes=_LOG_MAX_BYTES,
+        backupCount=_LOG_BACKUP_COUNT,
+        encoding="utf-8",
+        delay=True,
+    )
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    _listener = QueueListener(_log_queue, handler)
+    _listener.start()
+
+
+def stop_debug_log() -> None:
+    """Flush pending records and stop the writer thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def log_event(
+    message: str,
+    data: Union[Dict[str, Any], Callable[[], Dict[str, Any]]],
+    location: str,
+    tag: str,
+) -> None:
+    """Record a debug event without blocking the caller.
+    
+    ``data`` may be a zero-argument callable so the payload is only built
+    when debug logging is enabled.
+    """
+    if not _LOG_ENABLED:
+        return
+    if callable(data):
+        data = data()
+    # orjson serializes UUIDs and datetimes natively, so callers can pass them raw
+    logger.info(orjson.dumps({
+        "message": message,
+        "data": data,
+        "location": location,
+        "tag": tag,
+        "timestamp": time.time_ns() // 1_000_000,
+    }, default=str).decode())
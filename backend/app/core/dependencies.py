@@ -1,25 +1,77 @@
+import threading
+import time
 from typing import Optional
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from uuid import UUID
 from app.core.security import decode_access_token
 from app.db.base import get_db as get_db_session
 from app.db.database_service import DatabaseService
+from app.db.models import STAFF_ROLES
+from app.services.auth_service import AuthService
+from app.services.game_service import GameService
+from app.services.statistics_service import StatisticsService
 
 security = HTTPBearer()
 
+# Resolved users keyed by raw bearer token: (user, token expiry timestamp)
+_user_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+# Second layer keyed by user ID, so new tokens for a known user skip the DB lookup
+_user_id_cache: TTLCache = TTLCache(maxsize=10_000, ttl=300)
+_user_cache_lock = threading.Lock()
+
+
+def invalidate_cached_token(token: str) -> None:
+    """Drop a token from the authenticated-user cache."""
+    with _user_cache_lock:
+        _user_cache.pop(token, None)
+
+
+def invalidate_cached_user(user_id: UUID) -> None:
+    """Drop every cached token resolving to the given user (e.g. after a password or role change)."""
+    with _user_cache_lock:
+        _user_id_cache.pop(user_id, None)
+        for token in [t for t, (user, _) in _user_cache.items() if user["id"] == user_id]:
+            _user_cache.pop(token, None)
+
 
 def get_db_service(db=Depends(get_db_session)) -> DatabaseService:
     """Get database service instance."""
     return DatabaseService(db)
 
 
-async def get_current_user(
+def get_auth_service(db_service: DatabaseService = Depends(get_db_service)) -> AuthService:
+    """Get auth service instance (built once per request and shared by dependants)."""
+    return AuthService(db_service)
+
+
+def get_game_service(db_service: DatabaseService = Depends(get_db_service)) -> GameService:
+    """Get game service instance (built once per request and shared by dependants)."""
+    return GameService(db_service)
+
+
+def get_statistics_service(db_service: DatabaseService = Depends(get_db_service)) -> StatisticsService:
+    """Get statistics service instance (built once per request and shared by dependants)."""
+    return StatisticsService(db_service)
+
+
+def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db_service: DatabaseService = Depends(get_db_service)
 ) -> dict:
     """Get current authenticated user from JWT token."""
     token = credentials.credentials
+    
+    # Warm tokens skip both signature verification and the user lookup
+    with _user_cache_lock:
+        cached = _user_cache.get(token)
+    if cached is not None:
+        user, expires_at = cached
+        if expires_at > time.time():
+            return user
+        invalidate_cached_token(token)
+    
     payload = decode_access_token(token)
     
     if payload is None:
@@ -30,7 +82,10 @@ async def get_current_user(
         )
     
     user_id = UUID(payload.get("sub"))
-    user = db_service.get_user_by_id(user_id)
+    with _user_cache_lock:
+        user = _user_id_cache.get(user_id)
+    if user is None:
+        user = db_service.get_user_by_id(user_id)
     
     if user is None:
         raise HTTPException(
@@ -39,6 +94,13 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
+    expires_at = payload.get("exp")
+    with _user_cache_lock:
+        # A token without an expiry can't be bounded, so it is verified every time
+        if expires_at is not None:
+            _user_cache[token] = (user, expires_at)
+        _user_id_cache[user_id] = user
+    
     return user
 
 
@@ -58,7 +120,7 @@ async def get_current_teacher_or_admin(
     current_user: dict = Depends(get_current_user)
 ) -> dict:
     """Require teacher or admin role."""
-    if current_user["role"] not in ["teacher", "admin"]:
+    if current_user["role"] not in STAFF_ROLES:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Teacher or admin access required"
@@ -1,13 +1,30 @@
-from datetime import datetime, timedelta
+from datetime import timedelta
 from typing import Optional
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from app.core.config import settings
+import base64
+import binascii
+import contextlib
 import hashlib
+import hmac
+import json
+import logging
+import time
 
+logger = logging.getLogger(__name__)
 
-# Configure bcrypt context with explicit backend and SHA-256 fallback
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+# Argon2id (OWASP parameters: 46 MiB, t=3, p=1) for new hashes; bcrypt is kept
+# so existing hashes still verify and get upgraded on the next successful login
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__type="ID",
+    argon2__memory_cost=46 * 1024,
+    argon2__rounds=3,
+    argon2__parallelism=1,
+)
 try:
     import bcrypt
     pwd_context.load_backend("bcrypt", bcrypt.__name__)
@@ -15,45 +32,134 @@ except Exception:
     # Fallback to default backend; verify/get_password_hash will handle errors
     pass
 
+# Signing inputs resolved once at import rather than on every token
+_SECRET = settings.secret_key.encode()
+_ALG = settings.algorithm
+_HS256_HEADER_B64 = base64.urlsafe_b64encode(b'{"alg":"HS256","typ":"JWT"}').rstrip(b"=").decode("ascii")
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against a hash (supports bcrypt and legacy SHA-256)."""
-    try:
+    with contextlib.suppress(ValueError):
         return pwd_context.verify(plain_password, hashed_password)
-    except Exception:
-        # Fallback for non-bcrypt hashes (for legacy/compat)
-        if hashed_password == hashlib.sha256(plain_password.encode()).hexdigest():
-            return True
-        return False
+    # Fallback for hashes passlib doesn't recognise (legacy SHA-256); constant-time compare
+    return hmac.compare_digest(
+        hashed_password.encode(),
+        hashlib.sha256(plain_password.encode()).hexdigest().encode(),
+    )
 
 
-def get_password_hash(password: str) -> str:
-    """Hash a password, with robust fallback if bcrypt backend misbehaves."""
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Check whether a stored hash uses a deprecated scheme or outdated parameters."""
     try:
-        # Primary: bcrypt via passlib
-        return pwd_context.hash(password)
+        return pwd_context.needs_update(hashed_password)
+    except ValueError:
+        # Legacy SHA-256 hashes are not recognised by passlib
+        return True
+
+
+def _sha256_hash(password: str) -> str:
+    """Fallback SHA-256 hash (still supported by verify_password)."""
+    return hashlib.sha256(password.encode()).hexdigest()
+
+
+def _probe_password_hash(password: str) -> str:
+    """Hash with passlib until it first succeeds, then bind it directly.
+    
+    Failures are not cached: they may be transient (e.g. argon2's memory
+    allocation), so later calls keep trying passlib before falling back.
+    """
+    global _hash_password
+    try:
+        # Primary: argon2id via passlib
+        password_hash = pwd_context.hash(password)
     except Exception:
-        # Fallback: SHA-256 hash (still supported by verify_password)
-        return hashlib.sha256(password.encode()).hexdigest()
+        logger.warning("Password hashing backend failed; falling back to SHA-256", exc_info=True)
+        return _sha256_hash(password)
+    _hash_password = pwd_context.hash
+    return password_hash
+
+
+_hash_password = _probe_password_hash
+
+
+def get_password_hash(password: str) -> str:
+    """Hash a password, with robust fallback if the passlib backend misbehaves."""
+    return _hash_password(password)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token."""
     to_encode = data.copy()
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        lifetime = expires_delta.total_seconds()
     else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.access_token_expire_minutes)
+        lifetime = settings.access_token_expire_minutes * 60
+    to_encode["exp"] = int(time.time() + lifetime)
     
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
-    return encoded_jwt
+    if _ALG == "HS256":
+        return _sign_hs256(to_encode)
+    return jwt.encode(to_encode, _SECRET, algorithm=_ALG)
+
+
+def _b64url_encode(raw: bytes) -> str:
+    """Encode bytes as an unpadded base64url JWT segment."""
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def _sign_hs256(payload: dict) -> str:
+    """Sign an HS256 JWT with hmac/hashlib directly, skipping python-jose."""
+    signing_input = f"{_HS256_HEADER_B64}.{_b64url_encode(json.dumps(payload, separators=(',', ':')).encode())}"
+    signature = hmac.new(_SECRET, signing_input.encode("ascii"), hashlib.sha256).digest()
+    return f"{signing_input}.{_b64url_encode(signature)}"
+
+
+def _b64url_decode(segment: str) -> bytes:
+    """Decode an unpadded base64url JWT segment."""
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+def _verify_hs256(token: str) -> Optional[dict]:
+    """Verify an HS256 JWT with hmac/hashlib directly, skipping python-jose."""
+    try:
+        header_b64, payload_b64, signature_b64 = token.split(".")
+        header = json.loads(_b64url_decode(header_b64))
+        if not isinstance(header, dict) or header.get("alg") != "HS256":
+            return None
+        
+        expected = hmac.new(
+            _SECRET,
+            f"{header_b64}.{payload_b64}".encode("ascii"),
+            hashlib.sha256,
+        ).digest()
+        if not hmac.compare_digest(expected, _b64url_decode(signature_b64)):
+            return None
+        
+        payload = json.loads(_b64url_decode(payload_b64))
+    except (ValueError, binascii.Error, UnicodeError):
+        return None
+    
+    if not isinstance(payload, dict):
+        return None
+    
+    now = time.time()
+    exp = payload.get("exp")
+    if exp is not None and (not isinstance(exp, (int, float)) or now > exp):
+        return None
+    nbf = payload.get("nbf")
+    if nbf is not None and (not isinstance(nbf, (int, float)) or nbf > now):
+        return None
+    
+    return payload
 
 
 def decode_access_token(token: str) -> Optional[dict]:
     """Decode and verify a JWT token."""
+    if _ALG == "HS256":
+        return _verify_hs256(token)
+    
     try:
-        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+        payload = jwt.decode(token, _SECRET, algorithms=[_ALG])
         return payload
     except JWTError:
         return None
@@ -1,23 +1,53 @@
 """
 Database base configuration and session management.
 """
-from sqlalchemy import create_engine
+import logging
+from sqlalchemy import create_engine, event, exists, select
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
 # Create database engine
-# For SQLite, we need to enable foreign key support
+# For SQLite, foreign key support and the performance pragmas are applied on
+# every new connection
 if settings.database_url.startswith("sqlite"):
+    _sqlite_in_memory = settings.database_url in ("sqlite://", "sqlite:///:memory:")
     engine = create_engine(
         settings.database_url,
         connect_args={"check_same_thread": False},
+        # An in-memory database only exists per connection, so share one
+        poolclass=StaticPool if _sqlite_in_memory else None,
         echo=False,  # Set to True for SQL query logging
     )
+    
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragma(dbapi_conn, connection_record):
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        # WAL lets readers proceed while a writer commits; NORMAL sync is safe with WAL
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+        cursor.execute("PRAGMA cache_size=-65536")  # 64 MiB
+        cursor.close()
 else:
     # PostgreSQL
+    # Pool sized above SQLAlchemy's default (5 + 10 overflow) with a short timeout
+    # so requests fail fast instead of queueing; pre-ping drops dead connections.
+    # LIFO hands out the most recently used connection, keeping a small warm set
+    # and letting idle extras age out via pool_recycle
     engine = create_engine(
         settings.database_url,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=True,
+        pool_use_lifo=True,
         echo=False,  # Set to True for SQL query logging
     )
 
@@ -52,20 +82,21 @@ def init_db():
     # Create all tables
     Base.metadata.create_all(bind=engine)
     
-    # For SQLite, enable foreign key support
-    if settings.database_url.startswith("sqlite"):
-        from sqlalchemy import event
-        @event.listens_for(engine, "connect")
-        def set_sqlite_pragma(dbapi_conn, connection_record):
-            cursor = dbapi_conn.cursor()
-            cursor.execute("PRAGMA foreign_keys=ON")
-            cursor.close()
+    # create_all skips tables that already exist, so databases created before
+    # the composite indexes were added would miss them; the attempt upsert
+    # needs the unique (session_id, word_id) index for ON CONFLICT
+    for table in (models.GameAttempt.__table__, models.GameSession.__table__, models.User.__table__):
+        for index in table.indexes:
+            try:
+                index.create(bind=engine, checkfirst=True)
+            except Exception as e:
+                logger.error("Error creating index %s: %s", index.name, e)
     
     # Create default admin user if it doesn't exist
     db = SessionLocal()
     try:
-        admin_user = db.query(User).filter(User.username == "admin").first()
-        if not admin_user:
+        has_admin = db.scalar(select(exists().where(User.username == "admin")))
+        if not has_admin:
             admin_user = User(
                 username="admin",
                 password_hash=get_password_hash("cantonese"),
@@ -73,9 +104,9 @@ def init_db():
             )
             db.add(admin_user)
             db.commit()
-            print("Default admin user created (username: admin, password: cantonese)")
+            logger.info("Default admin user created (username: admin, password: cantonese)")
     except Exception as e:
-        print(f"Error initializing admin user: {e}")
+        logger.error("Error initializing admin user: %s", e)
         db.rollback()
     finally:
         db.close()
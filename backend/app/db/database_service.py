@@ -2,11 +2,18 @@
 Database service layer that provides database operations using SQLAlchemy.
 This replaces mock_db and provides the same interface for services.
 """
-from typing import Optional, List, Dict
-from uuid import UUID
+from functools import lru_cache
+from typing import Optional, List, Dict, Iterator
+from uuid import UUID, uuid4
 from datetime import datetime, date
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError, OperationalError, ProgrammingError
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import (
+    Date, Integer, and_, bindparam, case, cast, delete, exists, func, insert, lambda_stmt, literal, select,
+    type_coerce
+)
 
 from app.db.models import (
     User, Deck, Word, GameSession, GameAttempt,
@@ -15,6 +22,75 @@ from app.db.models import (
 from app.core.security import get_password_hash, verify_password
 
 
+# IDs are stored as strings; the same handful of IDs (users, decks, words) is
+# parsed on every request, so memoize the str -> UUID conversion (UUIDs are immutable)
+_to_uuid = lru_cache(maxsize=65536)(UUID)
+
+
+def _user_row(user) -> Dict:
+    """Build a user dict from a User entity or a row of _USER_COLUMNS."""
+    return {
+        "id": _to_uuid(user.id),
+        "username": user.username,
+        "password_hash": user.password_hash,
+        "role": user.role,
+        "created_at": user.created_at,
+    }
+
+
+def _attempt_row(attempt) -> Dict:
+    """Build an attempt dict from a GameAttempt entity or a row of _ATTEMPT_COLUMNS."""
+    return {
+        "id": _to_uuid(attempt.id),
+        "session_id": _to_uuid(attempt.session_id),
+        "word_id": _to_uuid(attempt.word_id),
+        "is_correct": attempt.is_correct,
+        "response_time": attempt.response_time,
+        "attempted_at": attempt.attempted_at,
+    }
+
+
+# Statements for the hot lookups, built once so each call only binds parameters
+_SEL_USER_BY_USERNAME = select(User).where(User.username == bindparam("username"))
+_SEL_DECKS_WITH_WORD_COUNT = select(
+    Deck.id,
+    Deck.name,
+    Deck.description,
+    Deck.created_at,
+    select(func.count(Word.id))
+    .where(Word.deck_id == Deck.id)
+    .correlate(Deck)
+    .scalar_subquery()
+    .label("word_count"),
+)
+_SEL_WORDS_BY_DECK = select(Word).where(Word.deck_id == bindparam("deck_id"))
+_SEL_GAME_SESSION_WITH_ATTEMPTS = (
+    select(GameSession)
+    .options(joinedload(GameSession.game_attempts))
+    .where(GameSession.id == bindparam("session_id"))
+)
+_SEL_ATTEMPTS_BY_SESSION = select(GameAttempt).where(GameAttempt.session_id == bindparam("session_id"))
+
+# Rows fetched per batch when streaming large attempt result sets
+_STREAM_BATCH_SIZE = 1000
+
+# Column projections for list queries: plain Rows, no ORM object hydration
+_USER_COLUMNS = (User.id, User.username, User.password_hash, User.role, User.created_at)
+_ATTEMPT_COLUMNS = (
+    GameAttempt.id,
+    GameAttempt.session_id,
+    GameAttempt.word_id,
+    GameAttempt.is_correct,
+    GameAttempt.response_time,
+    GameAttempt.attempted_at,
+)
+
+# Expanding IN parameter: one cached compiled statement for any roster size
+_SEL_ATTEMPTS_BY_STUDENTS = select(*_ATTEMPT_COLUMNS).join(GameSession).where(
+    GameSession.user_id.in_(bindparam("student_ids", expanding=True))
+)
+
+
 class DatabaseService:
     """Service for database operations using SQLAlchemy."""
     
@@ -24,57 +100,58 @@ class DatabaseService:
     # User operations
     def get_user_by_id(self, user_id: UUID) -> Optional[Dict]:
         """Get user by ID."""
-        user = self.db.query(User).filter(User.id == str(user_id)).first()
+        # Primary-key lookup through the identity map; no query if already loaded
+        user = self.db.get(User, str(user_id))
         if not user:
             return None
+        return _user_row(user)
+    
+    def get_users_by_ids(self, user_ids: List[UUID]) -> Dict[UUID, Dict]:
+        """Get several users in a single query, keyed by user ID."""
+        users = self.db.query(User).filter(User.id.in_([str(uid) for uid in user_ids])).all()
         return {
-            "id": UUID(user.id),
-            "username": user.username,
-            "password_hash": user.password_hash,
-            "role": user.role,
-            "created_at": user.created_at,
+            _to_uuid(user.id): _user_row(user)
+            for user in users
         }
     
     def get_user_by_username(self, username: str) -> Optional[Dict]:
         """Get user by username."""
-        user = self.db.query(User).filter(User.username == username).first()
+        user = self.db.execute(_SEL_USER_BY_USERNAME, {"username": username}).scalar_one_or_none()
         if not user:
             return None
-        return {
-            "id": UUID(user.id),
-            "username": user.username,
-            "password_hash": user.password_hash,
-            "role": user.role,
-            "created_at": user.created_at,
-        }
+        return _user_row(user)
     
     def create_user(self, username: str, password: str, role: str) -> Dict:
         """Create a new user."""
-        # Check if username already exists
-        if self.get_user_by_username(username):
-            raise ValueError("Username already exists")
-        
         password_hash = get_password_hash(password)
-        user = User(
+        # ID and timestamp are set client-side so the row needn't be re-read after commit
+        user_id = uuid4()
+        created_at = datetime.utcnow()
+        self.db.add(User(
+            id=str(user_id),
             username=username,
             password_hash=password_hash,
             role=role,
-        )
-        self.db.add(user)
-        self.db.commit()
-        self.db.refresh(user)
+            created_at=created_at,
+        ))
+        # The unique index on username rejects duplicates; no pre-check SELECT
+        try:
+            self.db.commit()
+        except IntegrityError:
+            self.db.rollback()
+            raise ValueError("Username already exists")
         
         return {
-            "id": UUID(user.id),
-            "username": user.username,
-            "password_hash": user.password_hash,
-            "role": user.role,
-            "created_at": user.created_at,
+            "id": user_id,
+            "username": username,
+            "password_hash": password_hash,
+            "role": role,
+            "created_at": created_at,
         }
     
     def reset_user_password(self, user_id: UUID, new_password: str) -> bool:
         """Reset user password."""
-        user = self.db.query(User).filter(User.id == str(user_id)).first()
+        user = self.db.get(User, str(user_id))
         if not user:
             return False
         
@@ -85,11 +162,11 @@ class DatabaseService:
     # Deck operations
     def get_deck(self, deck_id: UUID) -> Optional[Dict]:
         """Get deck by ID."""
-        deck = self.db.query(Deck).filter(Deck.id == str(deck_id)).first()
+        deck = self.db.get(Deck, str(deck_id))
         if not deck:
             return None
         return {
-            "id": UUID(deck.id),
+            "id": _to_uuid(deck.id),
             "name": deck.name,
             "description": deck.description,
             "created_at": deck.created_at,
@@ -97,23 +174,14 @@ class DatabaseService:
     
     def get_all_decks(self) -> List[Dict]:
         """Get all decks."""
-        # Include word counts for each deck so the frontend can display them
-        decks = (
-            self.db.query(
-                Deck.id,
-                Deck.name,
-                Deck.description,
-                Deck.created_at,
-                func.count(Word.id).label("word_count"),
-            )
-            .outerjoin(Word, Word.deck_id == Deck.id)
-            .group_by(Deck.id)
-            .all()
-        )
+        # Include word counts for each deck so the frontend can display them; a
+        # correlated count per deck probes ix_words_deck_id instead of
+        # aggregating the whole words table
+        decks = self.db.execute(_SEL_DECKS_WITH_WORD_COUNT).all()
 
         return [
             {
-                "id": UUID(deck.id),
+                "id": _to_uuid(deck.id),
                 "name": deck.name,
                 "description": deck.description,
                 "created_at": deck.created_at,
@@ -124,101 +192,124 @@ class DatabaseService:
     
     def create_deck(self, name: str, description: Optional[str] = None) -> Dict:
         """Create a new deck."""
-        deck = Deck(name=name, description=description)
-        self.db.add(deck)
+        deck_id = uuid4()
+        created_at = datetime.utcnow()
+        self.db.add(Deck(id=str(deck_id), name=name, description=description, created_at=created_at))
         self.db.commit()
-        self.db.refresh(deck)
         
         return {
-            "id": UUID(deck.id),
-            "name": deck.name,
-            "description": deck.description,
-            "created_at": deck.created_at,
+            "id": deck_id,
+            "name": name,
+            "description": description,
+            "created_at": created_at,
             "word_count": 0,
         }
     
     def delete_deck(self, deck_id: UUID) -> bool:
-        """Delete a deck (cascade will delete words)."""
-        deck = self.db.query(Deck).filter(Deck.id == str(deck_id)).first()
-        if not deck:
-            return False
-        
-        self.db.delete(deck)
+        """Delete a deck with its words, sessions and their attempts."""
+        deck_id = str(deck_id)
+        # The foreign keys have no ON DELETE CASCADE, so remove the children
+        # with bulk deletes instead of loading them for the ORM cascade
+        session_ids = select(GameSession.id).where(GameSession.deck_id == deck_id)
+        word_ids = select(Word.id).where(Word.deck_id == deck_id)
+        self.db.execute(
+            delete(GameAttempt).where(
+                GameAttempt.session_id.in_(session_ids) | GameAttempt.word_id.in_(word_ids)
+            )
+        )
+        self.db.execute(delete(GameSession).where(GameSession.deck_id == deck_id))
+        self.db.execute(delete(Word).where(Word.deck_id == deck_id))
+        result = self.db.execute(delete(Deck).where(Deck.id == deck_id))
         self.db.commit()
-        return True
+        return result.rowcount > 0
     
     # Word operations
     def get_word(self, word_id: UUID) -> Optional[Dict]:
         """Get word by ID."""
-        word = self.db.query(Word).filter(Word.id == str(word_id)).first()
+        word = self.db.get(Word, str(word_id))
         if not word:
             return None
         return {
-            "id": UUID(word.id),
+            "id": _to_uuid(word.id),
             "text": word.text,
             "jyutping": word.jyutping,
-            "deck_id": UUID(word.deck_id),
+            "deck_id": _to_uuid(word.deck_id),
             "created_at": word.created_at,
         }
     
     def get_words_by_deck(self, deck_id: UUID) -> List[Dict]:
         """Get all words in a deck."""
-        words = self.db.query(Word).filter(Word.deck_id == str(deck_id)).all()
+        words = self.db.execute(_SEL_WORDS_BY_DECK, {"deck_id": str(deck_id)}).scalars().all()
         return [
             {
-                "id": UUID(word.id),
+                "id": _to_uuid(word.id),
                 "text": word.text,
                 "jyutping": word.jyutping,
-                "deck_id": UUID(word.deck_id),
+                "deck_id": _to_uuid(word.deck_id),
                 "created_at": word.created_at,
             }
             for word in words
         ]
     
+    def get_words_by_ids(self, word_ids: List[UUID]) -> Dict[UUID, Dict]:
+        """Get several words in a single query, keyed by word ID."""
+        words = self.db.query(Word).filter(Word.id.in_([str(wid) for wid in word_ids])).all()
+        return {
+            _to_uuid(word.id): {
+                "id": _to_uuid(word.id),
+                "text": word.text,
+                "jyutping": word.jyutping,
+                "deck_id": _to_uuid(word.deck_id),
+                "created_at": word.created_at,
+            }
+            for word in words
+        }
+    
     def create_word(self, text: str, jyutping: str, deck_id: UUID) -> Dict:
         """Create a new word."""
-        word = Word(
+        word_id = uuid4()
+        created_at = datetime.utcnow()
+        self.db.add(Word(
+            id=str(word_id),
             text=text,
             jyutping=jyutping,
             deck_id=str(deck_id),
-        )
-        self.db.add(word)
+            created_at=created_at,
+        ))
         self.db.commit()
-        self.db.refresh(word)
         
         return {
-            "id": UUID(word.id),
-            "text": word.text,
-            "jyutping": word.jyutping,
-            "deck_id": UUID(word.deck_id),
-            "created_at": word.created_at,
+            "id": word_id,
+            "text": text,
+            "jyutping": jyutping,
+            "deck_id": deck_id,
+            "created_at": created_at,
         }
     
     def delete_word(self, word_id: UUID) -> bool:
-        """Delete a word."""
-        word = self.db.query(Word).filter(Word.id == str(word_id)).first()
-        if not word:
-            return False
-        
-        self.db.delete(word)
+        """Delete a word and its attempts."""
+        word_id = str(word_id)
+        self.db.execute(delete(GameAttempt).where(GameAttempt.word_id == word_id))
+        result = self.db.execute(delete(Word).where(Word.id == word_id))
         self.db.commit()
-        return True
+        return result.rowcount > 0
     
     # Game session operations
     def get_game_session(self, session_id: UUID) -> Optional[Dict]:
         """Get game session by ID."""
-        session = self.db.query(GameSession).filter(GameSession.id == str(session_id)).first()
+        # Load the session and its attempts (for the word IDs) in one round-trip
+        session = self.db.execute(
+            _SEL_GAME_SESSION_WITH_ATTEMPTS, {"session_id": str(session_id)}
+        ).unique().scalar_one_or_none()
         if not session:
             return None
         
-        # Get word IDs from attempts
-        attempts = self.db.query(GameAttempt).filter(GameAttempt.session_id == str(session_id)).all()
-        word_ids = [UUID(attempt.word_id) for attempt in attempts]
+        word_ids = [_to_uuid(attempt.word_id) for attempt in session.game_attempts]
         
         return {
-            "id": UUID(session.id),
-            "user_id": UUID(session.user_id),
-            "deck_id": UUID(session.deck_id),
+            "id": _to_uuid(session.id),
+            "user_id": _to_uuid(session.user_id),
+            "deck_id": _to_uuid(session.deck_id),
             "word_ids": word_ids,
             "score": session.score,
             "started_at": session.started_at,
@@ -227,39 +318,49 @@ class DatabaseService:
     
     def create_game_session(self, user_id: UUID, deck_id: UUID, word_ids: List[UUID]) -> Dict:
         """Create a new game session."""
+        # Set started_at client-side so nothing has to be read back after the insert
+        started_at = datetime.utcnow()
         session = GameSession(
             user_id=str(user_id),
             deck_id=str(deck_id),
+            started_at=started_at,
         )
         self.db.add(session)
-        self.db.commit()
-        self.db.refresh(session)
+        # Flush (not commit) to assign the session ID; everything commits once below
+        self.db.flush()
+        session_id = session.id
         
         # Create placeholder attempts for each word (will be updated when pronunciation is submitted)
-        for word_id in word_ids:
-            attempt = GameAttempt(
-                session_id=session.id,
-                word_id=str(word_id),
-                is_correct=False,  # Placeholder, will be updated
-                response_time=0,  # Placeholder
+        # in a single executemany INSERT rather than one ORM object per word
+        if word_ids:
+            self.db.execute(
+                insert(GameAttempt),
+                [
+                    {
+                        "session_id": session_id,
+                        "word_id": str(word_id),
+                        "is_correct": False,  # Placeholder, will be updated
+                        "response_time": 0,  # Placeholder
+                    }
+                    for word_id in word_ids
+                ]
             )
-            self.db.add(attempt)
         
         self.db.commit()
         
         return {
-            "id": UUID(session.id),
-            "user_id": UUID(session.user_id),
-            "deck_id": UUID(session.deck_id),
+            "id": _to_uuid(session_id),
+            "user_id": user_id,
+            "deck_id": deck_id,
             "word_ids": word_ids,
             "score": None,
-            "started_at": session.started_at,
+            "started_at": started_at,
             "ended_at": None,
         }
     
     def update_game_session(self, session_id: UUID, score: Optional[int] = None, ended_at: Optional[datetime] = None):
         """Update game session."""
-        session = self.db.query(GameSession).filter(GameSession.id == str(session_id)).first()
+        session = self.db.get(GameSession, str(session_id))
         if not session:
             return
         
@@ -273,98 +374,113 @@ class DatabaseService:
     # Game attempt operations
     def create_game_attempt(self, session_id: UUID, word_id: UUID, is_correct: bool, response_time: int) -> Dict:
         """Create or update a game attempt record."""
-        # Check if attempt already exists (from placeholder)
-        attempt = self.db.query(GameAttempt).filter(
-            and_(
-                GameAttempt.session_id == str(session_id),
-                GameAttempt.word_id == str(word_id)
-            )
-        ).first()
-        
-        if attempt:
-            # Update existing attempt
-            attempt.is_correct = is_correct
-            attempt.response_time = response_time
-            attempt.attempted_at = datetime.utcnow()
-        else:
-            # Create new attempt
-            attempt = GameAttempt(
-                session_id=str(session_id),
-                word_id=str(word_id),
-                is_correct=is_correct,
-                response_time=response_time,
+        # Update the placeholder attempt, or insert if missing, in a single
+        # INSERT ... ON CONFLICT (session_id, word_id) DO UPDATE round-trip.
+        # attempted_at is Python UTC like every other timestamp in this service;
+        # the database's now() would be in the session timezone on PostgreSQL.
+        attempted_at = datetime.utcnow()
+        dialect_insert = pg_insert if self.db.get_bind().dialect.name == "postgresql" else sqlite_insert
+        stmt = dialect_insert(GameAttempt).values(
+            id=str(uuid4()),
+            session_id=str(session_id),
+            word_id=str(word_id),
+            is_correct=is_correct,
+            response_time=response_time,
+            attempted_at=attempted_at,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[GameAttempt.session_id, GameAttempt.word_id],
+            set_={
+                "is_correct": stmt.excluded.is_correct,
+                "response_time": stmt.excluded.response_time,
+                "attempted_at": stmt.excluded.attempted_at,
+            },
+        ).returning(GameAttempt.id)
+        try:
+            attempt_id = self.db.execute(stmt).scalar_one()
+        except (OperationalError, ProgrammingError):
+            # Databases not migrated past 002 (ix_attempt_session_word) have no
+            # unique index for ON CONFLICT to target; update or insert instead
+            self.db.rollback()
+            attempt_id = self._save_attempt_without_upsert(
+                session_id, word_id, is_correct, response_time, attempted_at
             )
-            self.db.add(attempt)
-        
         self.db.commit()
-        self.db.refresh(attempt)
         
         return {
-            "id": UUID(attempt.id),
-            "session_id": UUID(attempt.session_id),
-            "word_id": UUID(attempt.word_id),
-            "is_correct": attempt.is_correct,
-            "response_time": attempt.response_time,
-            "attempted_at": attempt.attempted_at,
+            "id": _to_uuid(attempt_id),
+            "session_id": session_id,
+            "word_id": word_id,
+            "is_correct": is_correct,
+            "response_time": response_time,
+            "attempted_at": attempted_at,
         }
     
+    def _save_attempt_without_upsert(
+        self, session_id: UUID, word_id: UUID, is_correct: bool, response_time: int, attempted_at: datetime
+    ) -> str:
+        """Update the (session, word) attempt or insert it, without ON CONFLICT."""
+        attempt = self.db.execute(
+            select(GameAttempt).where(
+                GameAttempt.session_id == str(session_id),
+                GameAttempt.word_id == str(word_id),
+            )
+        ).scalars().first()
+        if attempt is None:
+            attempt = GameAttempt(id=str(uuid4()), session_id=str(session_id), word_id=str(word_id))
+            self.db.add(attempt)
+        attempt.is_correct = is_correct
+        attempt.response_time = response_time
+        attempt.attempted_at = attempted_at
+        self.db.flush()
+        return attempt.id
+    
     def get_attempts_by_session(self, session_id: UUID) -> List[Dict]:
         """Get all attempts for a session."""
-        attempts = self.db.query(GameAttempt).filter(GameAttempt.session_id == str(session_id)).all()
+        attempts = self.db.execute(_SEL_ATTEMPTS_BY_SESSION, {"session_id": str(session_id)}).scalars().all()
         return [
-            {
-                "id": UUID(attempt.id),
-                "session_id": UUID(attempt.session_id),
-                "word_id": UUID(attempt.word_id),
-                "is_correct": attempt.is_correct,
-                "response_time": attempt.response_time,
-                "attempted_at": attempt.attempted_at,
-            }
+            _attempt_row(attempt)
             for attempt in attempts
         ]
     
-    def get_attempts_by_user(self, user_id: UUID, deck_id: Optional[UUID] = None) -> List[Dict]:
-        """Get all attempts for a user."""
-        # Use explicit join condition to avoid potential duplicates
-        query = self.db.query(GameAttempt).join(
+    def get_attempts_by_user(self, user_id: UUID, deck_id: Optional[UUID] = None) -> Iterator[Dict]:
+        """Get all attempts for a user (streamed; iterate once)."""
+        # Use explicit join condition to avoid potential duplicates. Built as a
+        # lambda statement with named bind parameters, so the construction and
+        # its cache key are computed once per shape (with/without deck filter)
+        stmt = lambda_stmt(lambda: select(*_ATTEMPT_COLUMNS).join(
             GameSession, GameAttempt.session_id == GameSession.id
-        ).filter(GameSession.user_id == str(user_id))
+        ).where(GameSession.user_id == bindparam("user_id")))
+        params = {"user_id": str(user_id)}
         
         if deck_id:
-            query = query.filter(GameSession.deck_id == str(deck_id))
+            stmt += lambda s: s.where(GameSession.deck_id == bindparam("deck_id"))
+            params["deck_id"] = str(deck_id)
         
-        # Use distinct to ensure no duplicate attempts
-        attempts = query.distinct().all()
-        return [
-            {
-                "id": UUID(attempt.id),
-                "session_id": UUID(attempt.session_id),
-                "word_id": UUID(attempt.word_id),
-                "is_correct": attempt.is_correct,
-                "response_time": attempt.response_time,
-                "attempted_at": attempt.attempted_at,
-            }
+        # Use distinct to ensure no duplicate attempts; rows are fetched in
+        # batches as the caller iterates rather than materialized up front
+        stmt += lambda s: s.distinct()
+        attempts = self.db.execute(
+            stmt, params, execution_options={"yield_per": _STREAM_BATCH_SIZE}
+        )
+        return (
+            _attempt_row(attempt)
             for attempt in attempts
-        ]
+        )
     
-    def get_attempts_by_students(self, student_ids: List[UUID]) -> List[Dict]:
-        """Get all attempts for a list of students."""
+    def get_attempts_by_students(self, student_ids: List[UUID]) -> Iterator[Dict]:
+        """Get all attempts for a list of students (streamed; iterate once)."""
         student_id_strs = [str(sid) for sid in student_ids]
-        attempts = self.db.query(GameAttempt).join(GameSession).filter(
-            GameSession.user_id.in_(student_id_strs)
-        ).all()
+        attempts = self.db.execute(
+            _SEL_ATTEMPTS_BY_STUDENTS,
+            {"student_ids": student_id_strs},
+            execution_options={"yield_per": _STREAM_BATCH_SIZE},
+        )
         
-        return [
-            {
-                "id": UUID(attempt.id),
-                "session_id": UUID(attempt.session_id),
-                "word_id": UUID(attempt.word_id),
-                "is_correct": attempt.is_correct,
-                "response_time": attempt.response_time,
-                "attempted_at": attempt.attempted_at,
-            }
+        return (
+            _attempt_row(attempt)
             for attempt in attempts
-        ]
+        )
     
     # Student-Teacher association operations
     def create_association(self, student_id: UUID, teacher_id: UUID):
@@ -387,49 +503,58 @@ class DatabaseService:
     
     def get_students_by_teacher(self, teacher_id: UUID) -> List[UUID]:
         """Get all student IDs associated with a teacher."""
-        associations = self.db.query(StudentTeacherAssociation).filter(
-            StudentTeacherAssociation.teacher_id == str(teacher_id)
-        ).all()
-        
-        return [UUID(assoc.student_id) for assoc in associations]
+        student_ids = self.db.scalars(
+            select(StudentTeacherAssociation.student_id).where(
+                StudentTeacherAssociation.teacher_id == str(teacher_id)
+            )
+        )
+        return [_to_uuid(student_id) for student_id in student_ids]
+    
+    def get_teachers_by_student(self, student_id: UUID) -> List[UUID]:
+        """Get all teacher IDs associated with a student."""
+        teacher_ids = self.db.scalars(
+            select(StudentTeacherAssociation.teacher_id).where(
+                StudentTeacherAssociation.student_id == str(student_id)
+            )
+        )
+        return [_to_uuid(teacher_id) for teacher_id in teacher_ids]
+    
+    def is_student_of(self, teacher_id: UUID, student_id: UUID) -> bool:
+        """Check whether a student is associated with a teacher (single EXISTS query)."""
+        return self.db.scalar(
+            select(exists().where(
+                StudentTeacherAssociation.teacher_id == str(teacher_id),
+                StudentTeacherAssociation.student_id == str(student_id),
+            ))
+        )
     
     def get_all_students(self) -> List[Dict]:
         """Get all students."""
-        users = self.db.query(User).filter(User.role == "student").all()
+        users = self.db.execute(select(*_USER_COLUMNS).where(User.role == "student")).all()
         return [
-            {
-                "id": UUID(user.id),
-                "username": user.username,
-                "password_hash": user.password_hash,
-                "role": user.role,
-                "created_at": user.created_at,
-            }
+            _user_row(user)
             for user in users
         ]
     
     def get_all_teachers(self) -> List[Dict]:
         """Get all teachers."""
-        users = self.db.query(User).filter(User.role == "teacher").all()
+        users = self.db.execute(select(*_USER_COLUMNS).where(User.role == "teacher")).all()
         return [
-            {
-                "id": UUID(user.id),
-                "username": user.username,
-                "password_hash": user.password_hash,
-                "role": user.role,
-                "created_at": user.created_at,
-            }
+            _user_row(user)
             for user in users
         ]
     
     def get_all_associations(self) -> List[Dict]:
         """Get all student-teacher associations."""
-        associations = self.db.query(StudentTeacherAssociation).all()
+        associations = self.db.execute(
+            select(StudentTeacherAssociation.student_id, StudentTeacherAssociation.teacher_id)
+        )
         return [
             {
-                "student_id": UUID(assoc.student_id),
-                "teacher_id": UUID(assoc.teacher_id),
+                "student_id": _to_uuid(student_id),
+                "teacher_id": _to_uuid(teacher_id),
             }
-            for assoc in associations
+            for student_id, teacher_id in associations
         ]
     
     # User streak operations
@@ -446,24 +571,8 @@ class DatabaseService:
         if streak:
             streak.games_completed += 1
         else:
-            # Get previous streak to calculate current streak
-            previous_streaks = self.db.query(UserStreak).filter(
-                UserStreak.user_id == str(user_id)
-            ).order_by(UserStreak.date.desc()).all()
-            
-            current_streak = 1
-            if previous_streaks:
-                last_date = previous_streaks[0].date
-                if (game_date - last_date).days == 1:
-                    # Consecutive day - need to calculate from all streaks
-                    consecutive_days = 1
-                    for i in range(len(previous_streaks) - 1):
-                        if (previous_streaks[i].date - previous_streaks[i + 1].date).days == 1:
-                            consecutive_days += 1
-                        else:
-                            break
-                    current_streak = consecutive_days + 1
-            
+            # Streak lengths are derived from these rows in get_user_streak,
+            # so recording the day is all that's needed here
             streak = UserStreak(
                 user_id=str(user_id),
                 date=game_date,
@@ -473,65 +582,73 @@ class DatabaseService:
         
         self.db.commit()
     
+    def _day_number(self, column):
+        """Integer day number of a Date column (dialect-specific date arithmetic)."""
+        if self.db.get_bind().dialect.name == "sqlite":
+            return cast(func.julianday(column), Integer)
+        # PostgreSQL: date - date yields an integer number of days
+        return type_coerce(column - literal(date(1970, 1, 1), Date), Integer)
+    
     def get_user_streak(self, user_id: UUID) -> Dict:
         """Get user streak data."""
-        streaks = self.db.query(UserStreak).filter(
-            UserStreak.user_id == str(user_id)
-        ).order_by(UserStreak.date.desc()).all()
-        
-        if not streaks:
-            return {
-                "current_streak": 0,
-                "longest_streak": 0,
-            }
+        # Gaps-and-islands: consecutive dates share (day number - row number), so
+        # each group is one streak. Only the two resulting integers leave the DB.
+        numbered = select(
+            UserStreak.date.label("date"),
+            (
+                self._day_number(UserStreak.date)
+                - func.row_number().over(order_by=UserStreak.date)
+            ).label("grp"),
+        ).where(UserStreak.user_id == str(user_id)).subquery()
         
-        # Calculate current streak (consecutive days from today)
-        today = date.today()
-        current_streak = 0
-        longest_streak = 0
+        islands = select(
+            func.count().label("length"),
+            func.max(numbered.c.date).label("last_date"),
+        ).group_by(numbered.c.grp).subquery()
         
-        # Calculate longest streak
-        if len(streaks) > 0:
-            consecutive = 1
-            for i in range(len(streaks) - 1):
-                if (streaks[i].date - streaks[i + 1].date).days == 1:
-                    consecutive += 1
-                else:
-                    longest_streak = max(longest_streak, consecutive)
-                    consecutive = 1
-            longest_streak = max(longest_streak, consecutive)
-        
-        # Calculate current streak from most recent date
-        if streaks[0].date == today or streaks[0].date == date.today():
-            # Check consecutive days from most recent
-            consecutive = 1
-            for i in range(len(streaks) - 1):
-                if (streaks[i].date - streaks[i + 1].date).days == 1:
-                    consecutive += 1
-                else:
-                    break
-            current_streak = consecutive
+        # The current streak is the island ending today (0 if no game today)
+        longest_streak, current_streak = self.db.execute(
+            select(
+                func.max(islands.c.length),
+                func.max(case((islands.c.last_date == date.today(), islands.c.length), else_=0)),
+            )
+        ).one()
         
         return {
-            "current_streak": current_streak,
-            "longest_streak": longest_streak,
+            "current_streak": current_streak or 0,
+            "longest_streak": longest_streak or 0,
         }
     
     # Property to access game_sessions for statistics (for compatibility)
     @property
     def game_sessions(self):
         """Property to access game sessions (for compatibility with mock_db interface)."""
-        sessions = self.db.query(GameSession).all()
-        return {
-            UUID(session.id): {
-                "id": UUID(session.id),
-                "user_id": UUID(session.user_id),
-                "deck_id": UUID(session.deck_id),
-                "word_ids": [UUID(a.word_id) for a in session.game_attempts],
-                "score": session.score,
-                "started_at": session.started_at,
-                "ended_at": session.ended_at,
-            }
-            for session in sessions
-        }
+        # One LEFT JOIN instead of lazy-loading game_attempts per session
+        rows = self.db.query(
+            GameSession.id,
+            GameSession.user_id,
+            GameSession.deck_id,
+            GameSession.score,
+            GameSession.started_at,
+            GameSession.ended_at,
+            GameAttempt.word_id,
+        ).outerjoin(GameAttempt, GameAttempt.session_id == GameSession.id).all()
+        
+        sessions = {}
+        for row in rows:
+            session_id = _to_uuid(row.id)
+            session = sessions.get(session_id)
+            if session is None:
+                session = sessions[session_id] = {
+                    "id": session_id,
+                    "user_id": _to_uuid(row.user_id),
+                    "deck_id": _to_uuid(row.deck_id),
+                    "word_ids": [],
+                    "score": row.score,
+                    "started_at": row.started_at,
+                    "ended_at": row.ended_at,
+                }
+            if row.word_id is not None:
+                session["word_ids"].append(_to_uuid(row.word_id))
+        return sessions
 
@@ -2,7 +2,7 @@
 SQLAlchemy database models.
 """
 from datetime import datetime, date
-from sqlalchemy import Column, String, Boolean, Integer, ForeignKey, Date, DateTime, Enum as SQLEnum, UniqueConstraint
+from sqlalchemy import Column, String, Boolean, Integer, ForeignKey, Date, DateTime, Enum as SQLEnum, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
@@ -39,6 +39,10 @@ class UserRole(str, enum.Enum):
     ADMIN = "admin"
 
 
+# Roles allowed to view other users' statistics and teacher endpoints
+STAFF_ROLES = frozenset({UserRole.TEACHER.value, UserRole.ADMIN.value})
+
+
 class User(Base):
     """User model."""
     __tablename__ = "users"
@@ -46,7 +50,7 @@ class User(Base):
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     username = Column(String, unique=True, nullable=False, index=True)
     password_hash = Column(String, nullable=False)
-    role = Column(String, nullable=False, default=UserRole.STUDENT.value)  # Store as string for SQLite compatibility
+    role = Column(String, nullable=False, default=UserRole.STUDENT.value, index=True)  # Store as string for SQLite compatibility
     created_at = Column(DateTime, nullable=False, server_default=func.now())
     
     # Relationships
@@ -110,6 +114,11 @@ class GameSession(Base):
     user = relationship("User", back_populates="game_sessions")
     deck = relationship("Deck", back_populates="game_sessions")
     game_attempts = relationship("GameAttempt", back_populates="session", cascade="all, delete-orphan")
+    
+    # Per-user statistics filter on user and optionally deck
+    __table_args__ = (
+        Index("ix_gs_user_deck", "user_id", "deck_id"),
+    )
 
 
 class GameAttempt(Base):
@@ -126,6 +135,11 @@ class GameAttempt(Base):
     # Relationships
     session = relationship("GameSession", back_populates="game_attempts")
     word = relationship("Word", back_populates="game_attempts")
+    
+    # One attempt row per word per session; also serves the (session, word) lookup
+    __table_args__ = (
+        Index("ix_attempt_session_word", "session_id", "word_id", unique=True),
+    )
 
 
 class StudentTeacherAssociation(Base):
@@ -2,17 +2,39 @@
 Jyutping Mapping Engine
 Automatically generates jyutping transliteration for Chinese words.
 """
+from functools import lru_cache
 from typing import Optional
+import re
+
+# A jyutping syllable ends in its tone digit; pycantonese fuses a segment's
+# syllables ("nei5hou2"), while stored words use one space per syllable
+_SYLLABLE_RE = re.compile(r"[a-z]+[1-6]")
+
+
+# Marks a converter that has not been looked up yet (None means unavailable)
+_UNRESOLVED = object()
 
 
 class JyutpingEngine:
     """Engine for converting Chinese text to Jyutping."""
     
     def __init__(self):
-        # For now, we'll use a simple mapping or library
-        # In production, this would use pycantonese or a more sophisticated library
-        pass
+        # pycantonese is slow to import, so it is resolved on first use
+        self._characters_to_jyutping = _UNRESOLVED
     
+    def _converter(self):
+        """Return pycantonese.characters_to_jyutping, or None without pycantonese."""
+        if self._characters_to_jyutping is _UNRESOLVED:
+            try:
+                import pycantonese
+                self._characters_to_jyutping = pycantonese.characters_to_jyutping
+            except ImportError:
+                self._characters_to_jyutping = None
+        return self._characters_to_jyutping
+    
+    # Teachers re-add the same common words across decks; the engine is a
+    # process-wide singleton, so caching on the bound method is safe
+    @lru_cache(maxsize=8192)
     def get_jyutping(self, text: str) -> Optional[str]:
         """
         Convert Chinese text to Jyutping.
@@ -21,27 +43,28 @@ class JyutpingEngine:
             text: Chinese characters
             
         Returns:
-            Jyutping transliteration string, or None if conversion fails
+            Jyutping transliteration string, a mock placeholder if pycantonese is
+            unavailable or cannot romanise every segment, or None for empty text
         """
-        # For now, return a mock jyutping
-        # In production, this would use pycantonese or similar library
-        # Example: pycantonese.characters_to_jyutping(text)
-        
-        # Simple mock implementation - in production, use actual library
-        # This is a placeholder that returns a basic pattern
         if not text:
             return None
         
-        # For development, return a mock jyutping
-        # In production, replace with actual conversion:
-        # try:
-        #     import pycantonese
-        #     jyutping = pycantonese.characters_to_jyutping(text)
-        #     return " ".join(jyutping) if jyutping else None
-        # except Exception:
-        #     return None
+        converter = self._converter()
+        if converter is not None:
+            # Convert whole segments rather than joining per-character readings:
+            # many characters have context-dependent readings (e.g. 行 hang4/hong4)
+            try:
+                segments = converter(text)
+            except Exception:
+                segments = None
+            if segments and all(jyutping for _, jyutping in segments):
+                return " ".join(
+                    syllable
+                    for _, jyutping in segments
+                    for syllable in _SYLLABLE_RE.findall(jyutping)
+                )
         
-        # Mock implementation
+        # Mock placeholder, so words pycantonese can't romanise are still accepted
         return f"mock_{text}_jyutping"
 
 
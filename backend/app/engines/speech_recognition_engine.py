@@ -3,15 +3,24 @@ Speech Recognition Engine
 Evaluates if user's pronunciation matches the expected Cantonese word.
 Uses HuggingFace Whisper model fine-tuned for Cantonese speech recognition.
 """
-from typing import Optional, Tuple
+from concurrent.futures import Future
+from functools import lru_cache
+from typing import BinaryIO, Optional, Tuple, Union
+from cachetools import LRUCache
+import hashlib
 import io
 import json
+import queue
 import random
-import re
+import sys
+import threading
 import time
 
+from app.core.config import settings
+
 # Try to import ML dependencies, fall back to mock if not available
 try:
+    import numpy as np
     import torch
     import librosa
     from transformers import WhisperProcessor, WhisperForConditionalGeneration
@@ -22,6 +31,114 @@ except ImportError:
     WhisperForConditionalGeneration = None
 
 
+# Canned transcriptions returned when no ASR model is available
+_MOCK_TEXTS = (
+    "你好",   # Correct
+    "謝謝",   # Correct
+    "再見",   # Correct
+    "早晨",   # Correct
+    "晚安",   # Correct
+    "你好嗎",  # Variation
+    "多謝",   # Variation
+    "再會",   # Variation
+)
+
+
+# Dynamic batching window for concurrent transcriptions
+_MAX_BATCH = 8
+_MAX_WAIT_S = 0.02
+# Upper bound on a request's wait for its batch, so a stalled or dead batcher
+# thread sends callers to the fallback instead of pinning threadpool workers
+_TRANSCRIBE_TIMEOUT_S = 60
+
+
+class _TranscriptionBatcher:
+    """Collects Whisper input features from concurrent requests and decodes them together.
+    
+    Requests arrive on threadpool workers; each blocks on a Future while a single
+    daemon thread gathers up to _MAX_BATCH items (waiting at most _MAX_WAIT_S after
+    the first) and runs one generate() over the stacked features.
+    """
+    
+    def __init__(self, model, processor):
+        self._model = model
+        self._processor = processor
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        threading.Thread(target=self._run, name="whisper-batcher", daemon=True).start()
+    
+    def transcribe(self, input_features) -> str:
+        """Queue one (1, n_mels, frames) feature tensor and wait for its transcription.
+        
+        Raises TimeoutError if no result arrives within _TRANSCRIBE_TIMEOUT_S.
+        """
+        future: Future = Future()
+        self._queue.put((input_features, future))
+        try:
+            return future.result(timeout=_TRANSCRIBE_TIMEOUT_S)
+        except TimeoutError:
+            # Withdraw the request if the batcher hasn't picked it up yet
+            future.cancel()
+            raise
+    
+    def _next_batch(self) -> list:
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + _MAX_WAIT_S
+        while len(batch) < _MAX_BATCH:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=timeout))
+            except queue.Empty:
+                break
+        return batch
+    
+    def _run(self):
+        while True:
+            # Claim each future; ones cancelled by a timed-out caller are dropped
+            batch = [item for item in self._next_batch() if item[1].set_running_or_notify_cancel()]
+            if not batch:
+                continue
+            try:
+                # Whisper pads every clip to 30s, so feature tensors stack directly
+                input_features = batch[0][0] if len(batch) == 1 else torch.cat([f for f, _ in batch])
+                # inference_mode also skips autograd's version-counter bookkeeping
+                with torch.inference_mode():
+                    predicted_ids = self._model.generate(input_features)
+                texts = self._processor.batch_decode(predicted_ids, skip_special_tokens=True)
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+            for (_, future), text in zip(batch, texts):
+                future.set_result(text.strip())
+
+
+def _audio_digest(audio_data: Union[bytes, BinaryIO]) -> bytes:
+    """Content hash of the audio; file-like objects are hashed in chunks and rewound."""
+    if hasattr(audio_data, "read"):
+        digest = hashlib.file_digest(audio_data, lambda: hashlib.blake2b(digest_size=16)).digest()
+        audio_data.seek(0)
+        return digest
+    return hashlib.blake2b(audio_data, digest_size=16).digest()
+
+
+def _has_audio(audio_data: Union[bytes, BinaryIO, None]) -> bool:
+    """Whether any audio was supplied; file-like objects are sized via seek/tell and rewound."""
+    if not hasattr(audio_data, "read"):
+        return bool(audio_data)
+    position = audio_data.tell()
+    size = audio_data.seek(0, io.SEEK_END)
+    audio_data.seek(position)
+    return size > position
+
+
+@lru_cache(maxsize=4096)
+def _normalize_expected(text: str) -> str:
+    """Strip all whitespace from an expected word (deck vocabulary is small, so cache it)."""
+    return sys.intern("".join(text.split()))
+
+
 class SpeechRecognitionEngine:
     """Engine for evaluating pronunciation correctness."""
     
@@ -29,33 +146,53 @@ class SpeechRecognitionEngine:
         """Initialize the speech recognition engine."""
         self.processor = None
         self.model = None
+        self._batcher = None
+        # Transcriptions keyed by audio content hash; resubmitted clips skip inference
+        self._transcription_cache: LRUCache = LRUCache(maxsize=1024)
+        self._transcription_cache_lock = threading.Lock()
         self.use_whisper = False
-        self._model_loading = False
         self._model_loaded = False
+        # Serialises the first load across threadpool workers
+        self._model_lock = threading.Lock()
+        # Own RNG for mock transcriptions, so tests can seed it in isolation
+        self._rng = random.Random()
         
-        # Don't load model during initialization - load lazily on first use
-        # This prevents blocking server startup
+        # Don't load model during initialization - it loads on first use, or
+        # during startup via warm_up() when SPEECH_WARMUP_ON_STARTUP is enabled
         if not TRANSFORMERS_AVAILABLE:
             print("Warning: transformers not installed. Using mock implementation.")
             print("Install with: uv add transformers torch librosa")
     
     def _ensure_model_loaded(self):
-        """Lazily load the model on first use."""
-        if self._model_loaded or self._model_loading:
-            return
-        
-        if not TRANSFORMERS_AVAILABLE:
+        """Lazily load the model on first use (double-checked, so it loads once)."""
+        if self._model_loaded or not TRANSFORMERS_AVAILABLE:
             return
         
-        self._model_loading = True
+        with self._model_lock:
+            if self._model_loaded:
+                return
+            self._load_model()
+    
+    def _load_model(self):
+        """Load the Whisper model; called with _model_lock held."""
         try:
             # Load HuggingFace Whisper model fine-tuned for Cantonese
             # Model: alvanlii/whisper-small-cantonese
             # This model is specifically optimized for Cantonese speech recognition
             print("Loading HuggingFace Whisper ASR model for Cantonese...")
             self.processor = WhisperProcessor.from_pretrained("alvanlii/whisper-small-cantonese")
-            self.model = WhisperForConditionalGeneration.from_pretrained("alvanlii/whisper-small-cantonese")
+            self.model = WhisperForConditionalGeneration.from_pretrained(
+                "alvanlii/whisper-small-cantonese",
+                attn_implementation="sdpa",  # fused scaled_dot_product_attention kernel
+            )
             self.model.eval()  # Set to evaluation mode
+            if settings.speech_quantize_int8:
+                # int8 weights for the Linear layers: ~4x less memory traffic in
+                # the bandwidth-bound decoder, using PyTorch's own int8 GEMM kernels
+                self.model = torch.ao.quantization.quantize_dynamic(
+                    self.model, {torch.nn.Linear}, dtype=torch.qint8
+                )
+            self._batcher = _TranscriptionBatcher(self.model, self.processor)
             self.use_whisper = True
             self._model_loaded = True
             print("HuggingFace Whisper model loaded successfully!")
@@ -64,13 +201,33 @@ class SpeechRecognitionEngine:
             print("Falling back to mock implementation")
             self.use_whisper = False
             self._model_loaded = True  # Mark as loaded even if failed to prevent retries
-        finally:
-            self._model_loading = False
     
-    def _transcribe_audio(self, audio_data: bytes) -> str:
+    def warm_up(self, iterations: int = 2):
+        """Load the model and run silent inferences so kernels and allocators are primed.
+        
+        The second iteration is the one that reaches steady state; without the
+        ML dependencies this is a no-op.
+        """
+        self._ensure_model_loaded()
+        if not (self.use_whisper and self.model and self.processor):
+            return
+        
+        try:
+            silence = np.zeros(16000, dtype=np.float32)  # 1s at Whisper's 16kHz
+            input_features = self.processor(silence, sampling_rate=16000, return_tensors="pt").input_features
+            for _ in range(iterations):
+                self._batcher.transcribe(input_features)
+        except Exception as e:
+            print(f"Warning: Whisper warm-up failed: {e}")
+    
+    def _transcribe_audio(self, audio_data: Union[bytes, BinaryIO]) -> str:
         """
         Transcribe audio to text using HuggingFace Whisper ASR model.
         
+        Args:
+            audio_data: Audio bytes, or a file-like object (e.g. a spooled upload)
+                        which is decoded directly without buffering it first
+        
         Returns:
             Recognized text in Chinese characters (Cantonese)
         """
@@ -80,22 +237,26 @@ class SpeechRecognitionEngine:
         
         if self.use_whisper and self.model and self.processor:
             try:
-                # Load audio from bytes using librosa
+                key = _audio_digest(audio_data)
+                with self._transcription_cache_lock:
+                    cached = self._transcription_cache.get(key)
+                if cached is not None:
+                    return cached
+                
+                # Load audio using librosa (file-like objects are read in place)
                 # librosa automatically resamples to 16kHz (required by Whisper)
-                audio_array, sampling_rate = librosa.load(io.BytesIO(audio_data), sr=16000)
+                audio_source = audio_data if hasattr(audio_data, "read") else io.BytesIO(audio_data)
+                audio_array, sampling_rate = librosa.load(audio_source, sr=16000)
                 
                 # Process audio with WhisperProcessor
                 input_features = self.processor(audio_array, sampling_rate=sampling_rate, return_tensors="pt").input_features
                 
-                # Generate transcription
-                with torch.no_grad():
-                    predicted_ids = self.model.generate(input_features)
-                
-                # Decode transcription
-                transcription = self.processor.batch_decode(predicted_ids, skip_special_tokens=True)[0]
-                
+                # Generate and decode, batched with any concurrent requests
                 # Return Chinese characters directly for comparison
-                return transcription.strip()
+                transcription = self._batcher.transcribe(input_features)
+                with self._transcription_cache_lock:
+                    self._transcription_cache[key] = transcription
+                return transcription
                         
             except Exception as e:
                 print(f"Error in HuggingFace Whisper transcription: {e}")
@@ -110,17 +271,7 @@ class SpeechRecognitionEngine:
         Mock transcription for testing when transformers is not available.
         Returns Chinese characters for testing purposes.
         """
-        mock_texts = [
-            "你好",   # Correct
-            "謝謝",   # Correct
-            "再見",   # Correct
-            "早晨",   # Correct
-            "晚安",   # Correct
-            "你好嗎",  # Variation
-            "多謝",   # Variation
-            "再會",   # Variation
-        ]
-        return random.choice(mock_texts)
+        return _MOCK_TEXTS[self._rng.randrange(len(_MOCK_TEXTS))]
     
     def _compare_pronunciation(
         self,
@@ -137,12 +288,17 @@ class SpeechRecognitionEngine:
         Returns:
             True if the Chinese characters match
         """
-        # Normalize whitespace for comparison
-        recognized = re.sub(r'\s+', '', recognized_text.strip())
-        expected = re.sub(r'\s+', '', expected_text.strip())
+        expected = _normalize_expected(expected_text)
+        
+        # Recognitions rarely contain whitespace, so try the raw text first
+        if recognized_text == expected:
+            return True
+        # Removing whitespace only shortens the text, so a shorter one can't match
+        if len(recognized_text) <= len(expected):
+            return False
         
-        # Exact match
-        if recognized == expected:
+        # Normalize whitespace for comparison; str.split() avoids the regex engine
+        if "".join(recognized_text.split()) == expected:
             return True
         
         # For now, we'll do exact matching
@@ -176,7 +332,7 @@ class SpeechRecognitionEngine:
     
     def evaluate_pronunciation(
         self,
-        audio_data: bytes,
+        audio_data: Union[bytes, BinaryIO],
         expected_text: str,
         expected_jyutping: str,
         real_time_recognition: Optional[str] = None
@@ -185,7 +341,7 @@ class SpeechRecognitionEngine:
         Evaluate if the pronunciation matches the expected word.
         
         Args:
-            audio_data: Audio file bytes (WAV format)
+            audio_data: Audio file bytes or file-like object (WAV format)
             expected_text: Expected Chinese text
             expected_jyutping: Expected Jyutping transliteration (for display purposes only)
             real_time_recognition: Optional real-time recognition text from Web Speech API.
@@ -203,7 +359,8 @@ class SpeechRecognitionEngine:
                 recognized_text = real_time_recognition.strip()
             else:
                 # Fall back to HuggingFace Whisper transcription
-                if audio_data and len(audio_data) > 0:
+                # A spooled upload is always truthy, so check its size explicitly
+                if _has_audio(audio_data):
                     recognized_text = self._transcribe_audio(audio_data)
                 else:
                     # No audio provided - for testing, we'll use a mock
@@ -1,12 +1,38 @@
+from contextlib import asynccontextmanager
+import anyio.to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
+from app.core.responses import ORJSONResponse
+from app.core.debug_log import start_debug_log, stop_debug_log
 from app.api.routes import auth, decks, games, statistics, admin
+from app.engines import speech_recognition_engine
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup/shutdown hooks."""
+    # Sync route handlers run in anyio's threadpool (default 40 threads); size it
+    # to the DB connection pool so handlers wait for a thread, not a connection
+    anyio.to_thread.current_default_thread_limiter().total_tokens = (
+        settings.threadpool_size or settings.db_pool_size + settings.db_max_overflow
+    )
+    start_debug_log()
+    if settings.speech_warmup_on_startup:
+        # Pay the model load and first-inference cost before the first request
+        await anyio.to_thread.run_sync(speech_recognition_engine.warm_up)
+    try:
+        yield
+    finally:
+        stop_debug_log()
+
 
 app = FastAPI(
     title=settings.project_name,
     version="1.0.0",
     description="API for Cantonese Word Game - A pronunciation learning game",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # Debug: Print CORS origins
@@ -1,11 +1,15 @@
 from typing import Optional
 from uuid import UUID
 from app.db.database_service import DatabaseService
-from app.core.security import verify_password, create_access_token
+from app.core.security import verify_password, password_needs_rehash, create_access_token
 from app.api.models.schemas import User, AuthResponse
+from app.services.statistics_service import invalidate_statistics_cache
 from datetime import timedelta
 from app.core.config import settings
 
+# Roles a user may choose at self-registration
+_REGISTRABLE_ROLES = frozenset({"student", "teacher"})
+
 
 class AuthService:
     """Service for authentication operations."""
@@ -22,14 +26,22 @@ class AuthService:
         if not verify_password(password, user["password_hash"]):
             return None
         
+        # Transparently upgrade legacy bcrypt/SHA-256 hashes to argon2id
+        if password_needs_rehash(user["password_hash"]):
+            self.db.reset_user_password(user["id"], password)
+        
         return user
     
     def create_user(self, username: str, password: str, role: str) -> dict:
         """Create a new user."""
-        if role not in ["student", "teacher"]:
+        if role not in _REGISTRABLE_ROLES:
             raise ValueError("Role must be 'student' or 'teacher'")
         
-        return self.db.create_user(username, password, role)
+        user = self.db.create_user(username, password, role)
+        if role == "student":
+            # The admin's student list now has a new entry
+            invalidate_statistics_cache(user["id"])
+        return user
     
     def create_auth_response(self, user: dict) -> AuthResponse:
         """Create an authentication response with token."""
@@ -42,10 +54,5 @@ class AuthService:
         
         return AuthResponse(
             token=token,
-            user=User(
-                id=user["id"],
-                username=user["username"],
-                role=user["role"],
-                created_at=user["created_at"]
-            )
+            user=User.model_validate(user)
         )
\ No newline at end of file
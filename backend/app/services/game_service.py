@@ -1,10 +1,11 @@
-from typing import List, Optional
+from typing import BinaryIO, List, Optional, Union
 from uuid import UUID
 import random
 from datetime import datetime, date
 from app.db.database_service import DatabaseService
 from app.api.models.schemas import GameSession, GameWord, Word
 from app.engines.speech_recognition_engine import speech_recognition_engine
+from app.services.statistics_service import invalidate_statistics_cache
 
 
 class GameService:
@@ -26,18 +27,17 @@ class GameService:
             raise ValueError("Deck has no words")
         
         # Shuffle words (no duplicates)
+        random.shuffle(words)
         word_ids = [word["id"] for word in words]
-        random.shuffle(word_ids)
         
         # Create game session
         session = self.db.create_game_session(user_id, deck_id, word_ids)
         
-        # Build game words list
+        # Build game words list from the words already loaded
         game_words = []
-        for word_id in word_ids:
-            word = self.db.get_word(word_id)
+        for word in words:
             game_words.append(GameWord(
-                wordId=word_id,
+                wordId=word["id"],
                 text=word["text"],
                 isCorrect=None,
                 responseTime=None
@@ -58,7 +58,7 @@ class GameService:
         session_id: UUID,
         word_id: UUID,
         response_time: int,
-        audio_data: bytes = None,
+        audio_data: Optional[Union[bytes, BinaryIO]] = None,
         real_time_recognition: Optional[str] = None
     ) -> tuple[bool, str, Optional[str], str, str]:
         """Submit a pronunciation attempt."""
@@ -102,14 +102,17 @@ class GameService:
         # Get all attempts for this session
         attempts = self.db.get_attempts_by_session(session_id)
         
-        # Calculate score
-        correct_count = sum(1 for attempt in attempts if attempt["is_correct"])
+        # Calculate score; one pass also indexes attempts for the response below
+        correct_count = 0
+        total_response_time = 0
+        attempts_by_word_id = {}
+        for attempt in attempts:
+            correct_count += attempt["is_correct"]
+            total_response_time += attempt["response_time"]
+            attempts_by_word_id[attempt["word_id"]] = attempt
         total_words = len(session["word_ids"])
         
-        if attempts:
-            avg_response_time = sum(attempt["response_time"] for attempt in attempts) / len(attempts)
-        else:
-            avg_response_time = 0
+        avg_response_time = total_response_time / len(attempts) if attempts else 0
         
         # Score formula: (correct_words * 100) - (average_response_time / 100)
         score = int((correct_count * 100) - (avg_response_time / 100))
@@ -123,15 +126,14 @@ class GameService:
         user_id = session["user_id"]
         game_date = date.today()
         self.db.update_user_streak(user_id, game_date)
+        invalidate_statistics_cache(user_id, self.db.get_teachers_by_student(user_id))
         
-        # Build response with attempt data
+        # Build response with attempt data (one word query, O(1) attempt lookups)
+        words = self.db.get_words_by_ids(session["word_ids"])
         game_words = []
         for word_id in session["word_ids"]:
-            word = self.db.get_word(word_id)
-            attempt = next(
-                (a for a in attempts if a["word_id"] == word_id),
-                None
-            )
+            word = words[word_id]
+            attempt = attempts_by_word_id.get(word_id)
             
             game_words.append(GameWord(
                 wordId=word_id,
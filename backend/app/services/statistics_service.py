@@ -1,10 +1,37 @@
-from typing import Optional, List
+import threading
+from typing import Optional, List, Iterable
 from uuid import UUID
 from collections import defaultdict
 from datetime import date
+from cachetools import TTLCache
 from app.db.database_service import DatabaseService
+from app.db.models import STAFF_ROLES
 from app.api.models.schemas import GameStatistics, ScoreByDate, WrongWord, Student
 
+# Dashboard aggregates keyed by (kind, user_id, role); the TTL bounds staleness
+# for changes that don't invalidate explicitly
+_stats_cache: TTLCache = TTLCache(maxsize=1024, ttl=30)
+_stats_cache_lock = threading.Lock()
+
+
+def invalidate_statistics_cache(
+    user_id: Optional[UUID] = None,
+    teacher_ids: Iterable[UUID] = ()
+) -> None:
+    """Drop cached aggregates affected by a change to a student's games.
+    
+    The student's own entries go, along with those of the given teachers and
+    every admin, whose views include the student. Other teachers' entries are
+    left to the TTL. Without a user_id the whole cache is cleared.
+    """
+    with _stats_cache_lock:
+        if user_id is None:
+            _stats_cache.clear()
+            return
+        owners = {user_id, *teacher_ids}
+        for key in [k for k in _stats_cache if k[1] in owners or k[2] == "admin"]:
+            _stats_cache.pop(key, None)
+
 
 class StatisticsService:
     """Service for statistics operations."""
@@ -78,8 +105,42 @@ class StatisticsService:
             topWrongWords=top_wrong_words[:20]  # Top 20
         )
     
+    def get_statistics_authorized(
+        self,
+        current_user: dict,
+        target_user_id: Optional[UUID] = None,
+        deck_id: Optional[UUID] = None
+    ) -> GameStatistics:
+        """Get game statistics after checking the caller may view the target user.
+        
+        Raises PermissionError if the caller is not allowed to see the target's stats.
+        """
+        if target_user_id:
+            # Only teachers/admins can view other users' stats
+            if current_user["role"] not in STAFF_ROLES:
+                raise PermissionError("Cannot view other users' statistics")
+            
+            # Teachers can only view their students' stats
+            if current_user["role"] == "teacher":
+                if not self.db.is_student_of(current_user["id"], target_user_id):
+                    raise PermissionError("Cannot view this user's statistics")
+        
+        return self.get_statistics(current_user["id"], target_user_id, deck_id)
+    
     def get_students(self, user_id: UUID, user_role: str) -> List[Student]:
-        """Get list of students."""
+        """Get list of students (cached briefly per user)."""
+        key = ("students", user_id, user_role)
+        with _stats_cache_lock:
+            cached = _stats_cache.get(key)
+        if cached is not None:
+            return list(cached)
+        
+        result = self._get_students(user_id, user_role)
+        with _stats_cache_lock:
+            _stats_cache[key] = result
+        return list(result)
+    
+    def _get_students(self, user_id: UUID, user_role: str) -> List[Student]:
         if user_role == "admin":
             # Admin sees all students
             students = self.db.get_all_students()
@@ -113,12 +174,24 @@ class StatisticsService:
         return result
     
     def get_word_error_ratios(self, user_id: UUID, user_role: str) -> List[WrongWord]:
-        """Get word error ratios."""
+        """Get word error ratios (cached briefly per user)."""
+        key = ("error_ratios", user_id, user_role)
+        with _stats_cache_lock:
+            cached = _stats_cache.get(key)
+        if cached is not None:
+            return list(cached)
+        
+        result = self._get_word_error_ratios(user_id, user_role)
+        with _stats_cache_lock:
+            _stats_cache[key] = result
+        return list(result)
+    
+    def _get_word_error_ratios(self, user_id: UUID, user_role: str) -> List[WrongWord]:
         if user_role == "admin":
             # Admin sees all errors - get all attempts
             # We need to get attempts from all users
             all_students = self.db.get_all_students()
-            student_ids = [UUID(s["id"]) for s in all_students]
+            student_ids = [s["id"] for s in all_students]
             attempts = self.db.get_attempts_by_students(student_ids) if student_ids else []
         elif user_role == "teacher":
             # Teacher sees errors from their students
@@ -132,17 +205,22 @@ class StatisticsService:
     
     def _calculate_wrong_words(self, attempts: List[dict]) -> List[WrongWord]:
         """Calculate wrong word statistics from attempts."""
-        word_stats = defaultdict(lambda: {"correct": 0, "incorrect": 0})
+        # Keyed by UUID.int: int hashing is native, UUID.__hash__ is Python-level
+        word_stats = {}
         
         for attempt in attempts:
             word_id = attempt["word_id"]
+            stats = word_stats.get(word_id.int)
+            if stats is None:
+                stats = word_stats[word_id.int] = {"id": word_id, "correct": 0, "incorrect": 0}
             if attempt["is_correct"]:
-                word_stats[word_id]["correct"] += 1
+                stats["correct"] += 1
             else:
-                word_stats[word_id]["incorrect"] += 1
+                stats["incorrect"] += 1
         
         wrong_words = []
-        for word_id, stats in word_stats.items():
+        for stats in word_stats.values():
+            word_id = stats["id"]
             word = self.db.get_word(word_id)
             if not word:
                 continue
@@ -95,3 +95,27 @@ def test_admin_only_endpoints(client, student_user):
     )
     assert response.status_code == 403
 
+
+def test_create_association(client, admin_token, student_user, teacher_user):
+    """Test associating a student with a teacher."""
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    _, student = student_user
+    _, teacher = teacher_user
+    
+    response = client.post(
+        "/api/admin/associations",
+        json={"studentId": student["id"], "teacherId": teacher["id"]},
+        headers=headers
+    )
+    assert response.status_code == 204
+    
+    associations = client.get("/api/admin/associations", headers=headers).json()
+    assert {"studentId": student["id"], "teacherId": teacher["id"]} in associations
+    
+    # Swapped roles are rejected
+    response = client.post(
+        "/api/admin/associations",
+        json={"studentId": teacher["id"], "teacherId": student["id"]},
+        headers=headers
+    )
+    assert response.status_code == 400
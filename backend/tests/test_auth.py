@@ -66,3 +66,58 @@ def test_register_duplicate_username(client):
     assert response.status_code == 400
 
 
+def test_tampered_token_rejected(client, student_user):
+    """Test that a token with a modified payload is rejected."""
+    token, user = student_user
+    header, payload, signature = token.split(".")
+    forged_payload = payload[:-2] + ("AA" if payload[-2:] != "AA" else "BB")
+    
+    response = client.get(
+        "/api/decks",
+        headers={"Authorization": f"Bearer {header}.{forged_payload}.{signature}"}
+    )
+    assert response.status_code == 401
+
+
+def test_expired_token_rejected(client, student_user):
+    """Test that an expired token is rejected."""
+    from datetime import timedelta
+    from app.core.security import create_access_token
+    
+    token, user = student_user
+    expired = create_access_token({"sub": user["id"]}, expires_delta=timedelta(seconds=-1))
+    
+    response = client.get("/api/decks", headers={"Authorization": f"Bearer {expired}"})
+    assert response.status_code == 401
+
+
+def test_token_without_expiry_not_cached(client, student_user):
+    """Test that a signed token lacking exp is served without entering the user cache."""
+    from jose import jwt
+    from app.core import dependencies, security
+    
+    token, user = student_user
+    unbounded = jwt.encode({"sub": user["id"]}, security._SECRET, algorithm=security._ALG)
+    
+    response = client.get("/api/decks", headers={"Authorization": f"Bearer {unbounded}"})
+    assert response.status_code == 200
+    assert unbounded not in dependencies._user_cache
+
+
+def test_password_hash_fallback_not_cached(monkeypatch):
+    """Test that a failing hash backend falls back once without sticking."""
+    from app.core import security
+    
+    monkeypatch.setattr(security, "_hash_password", security._probe_password_hash)
+    calls = []
+    
+    def flaky_hash(password):
+        calls.append(password)
+        if len(calls) == 1:
+            raise MemoryError("argon2 allocation failed")
+        return "$argon2id$stub"
+    
+    monkeypatch.setattr(security.pwd_context, "hash", flaky_hash)
+    assert security.get_password_hash("pw") == security._sha256_hash("pw")
+    assert security.get_password_hash("pw") == "$argon2id$stub"
+    assert security._hash_password is flaky_hash
@@ -47,3 +47,18 @@ def test_get_words_by_deck_not_found(client, admin_token):
     response = client.get("/api/decks/00000000-0000-0000-0000-000000000999/words", headers=headers)
     assert response.status_code == 404
 
+
+def test_get_decks_word_count(client, admin_token):
+    """Test that deck listings include per-deck word counts."""
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    
+    full = client.post("/api/admin/decks", json={"name": "Full"}, headers=headers).json()
+    empty = client.post("/api/admin/decks", json={"name": "Empty"}, headers=headers).json()
+    for text in ["你好", "早晨"]:
+        client.post(f"/api/admin/decks/{full['id']}/words", json={"text": text}, headers=headers)
+    
+    response = client.get("/api/decks", headers=headers)
+    assert response.status_code == 200
+    counts = {d["id"]: d["wordCount"] for d in response.json()}
+    assert counts[full["id"]] == 2
+    assert counts[empty["id"]] == 0
@@ -1,3 +1,4 @@
+import io
 import pytest
 from fastapi.testclient import TestClient
 
@@ -103,3 +104,49 @@ def test_end_game(client, student_user):
     assert "endedAt" in ended_session
 
 
+def test_submit_pronunciation_word_not_in_session(client, admin_token, student_user):
+    """Test submitting pronunciation for a word outside the session."""
+    token, user = student_user
+    headers = {"Authorization": f"Bearer {token}"}
+    admin_headers = {"Authorization": f"Bearer {admin_token}"}
+    
+    deck = client.post("/api/admin/decks", json={"name": "Game Deck"}, headers=admin_headers).json()
+    client.post(f"/api/admin/decks/{deck['id']}/words", json={"text": "你好"}, headers=admin_headers)
+    
+    session = client.post(
+        "/api/games/start",
+        json={"deckId": deck["id"]},
+        headers=headers
+    ).json()
+    
+    response = client.post(
+        "/api/games/pronunciation",
+        data={
+            "sessionId": session["id"],
+            "wordId": "00000000-0000-0000-0000-000000000999",
+            "responseTime": "1500"
+        },
+        headers=headers
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Word not in this game session"
+
+
+@pytest.mark.parametrize("audio_data", [b"", io.BytesIO(b"")])
+def test_evaluate_pronunciation_empty_audio_skips_transcription(monkeypatch, audio_data):
+    """Test that empty uploads (bytes or file objects) use the no-audio path."""
+    from app.engines.speech_recognition_engine import speech_recognition_engine
+    
+    received = []
+    monkeypatch.setattr(
+        speech_recognition_engine,
+        "_transcribe_audio",
+        lambda data, *args: received.append(data) or "你好",
+    )
+    
+    is_correct, _, recognized_text = speech_recognition_engine.evaluate_pronunciation(
+        audio_data, "你好", "nei5 hou2"
+    )
+    assert received == [b"mock"]
+    assert is_correct is True
+    assert recognized_text == "你好"
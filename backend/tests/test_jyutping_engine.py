@@ -0,0 +1,27 @@
+from app.engines.jyutping_engine import JyutpingEngine
+
+
+def test_get_jyutping_converts_segments():
+    """Test that fused pycantonese segments become space-separated syllables."""
+    engine = JyutpingEngine()
+    engine._characters_to_jyutping = lambda text: [("你好", "nei5hou2"), ("嗎", "maa3")]
+    assert engine.get_jyutping("你好嗎") == "nei5 hou2 maa3"
+
+
+def test_get_jyutping_falls_back_when_unconvertible():
+    """Test that unconvertible or failing input gets the placeholder, not None."""
+    engine = JyutpingEngine()
+    engine._characters_to_jyutping = lambda text: [("你好", "nei5hou2"), ("X", None)]
+    assert engine.get_jyutping("你好X") == "mock_你好X_jyutping"
+    
+    def fail(text):
+        raise ValueError("unsupported input")
+    
+    engine = JyutpingEngine()
+    engine._characters_to_jyutping = fail
+    assert engine.get_jyutping("你好") == "mock_你好_jyutping"
+    
+    engine = JyutpingEngine()
+    engine._characters_to_jyutping = None  # pycantonese not installed
+    assert engine.get_jyutping("你好") == "mock_你好_jyutping"
+    assert engine.get_jyutping("") is None
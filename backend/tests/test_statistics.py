@@ -50,3 +50,70 @@ def test_get_word_error_ratios(client, student_user):
     assert isinstance(words, list)
 
 
+def test_get_statistics_teacher_scoped_to_students(client, admin_token, student_user, teacher_user):
+    """Test that teachers can only view statistics of their own students."""
+    _, student = student_user
+    teacher_token, teacher = teacher_user
+    teacher_headers = {"Authorization": f"Bearer {teacher_token}"}
+    
+    response = client.get(f"/api/statistics?userId={student['id']}", headers=teacher_headers)
+    assert response.status_code == 403
+    
+    client.post(
+        "/api/admin/associations",
+        json={"studentId": student["id"], "teacherId": teacher["id"]},
+        headers={"Authorization": f"Bearer {admin_token}"}
+    )
+    
+    response = client.get(f"/api/statistics?userId={student['id']}", headers=teacher_headers)
+    assert response.status_code == 200
+    assert response.json()["totalGames"] == 0
+
+
+def test_get_word_error_ratios_as_admin(client, admin_token, student_user):
+    """Test that admin error ratios reflect new attempts despite caching."""
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    student_token, _ = student_user
+    student_headers = {"Authorization": f"Bearer {student_token}"}
+    
+    response = client.get("/api/words/error-ratios", headers=headers)
+    assert response.status_code == 200
+    assert response.json() == []
+    
+    deck = client.post("/api/admin/decks", json={"name": "Ratios"}, headers=headers).json()
+    word = client.post(
+        f"/api/admin/decks/{deck['id']}/words", json={"text": "一"}, headers=headers
+    ).json()
+    session = client.post("/api/games/start", json={"deckId": deck["id"]}, headers=student_headers).json()
+    client.post(
+        "/api/games/pronunciation",
+        data={"sessionId": session["id"], "wordId": word["id"], "responseTime": "1000"},
+        headers=student_headers
+    )
+    client.post(f"/api/games/{session['id']}/end", headers=student_headers)
+    
+    response = client.get("/api/words/error-ratios", headers=headers)
+    assert response.status_code == 200
+    ratios = response.json()
+    assert len(ratios) == 1
+    assert ratios[0]["wordId"] == word["id"]
+    assert ratios[0]["totalAttempts"] == 1
+
+
+def test_get_statistics_streaks(client, test_db_session, student_user):
+    """Test current and longest streak calculation over gaps in play days."""
+    from datetime import date, timedelta
+    from app.db.models import UserStreak
+    
+    token, user = student_user
+    today = date.today()
+    # Current run: today, -1, -2; longest run: -5 .. -9; isolated day: -20
+    for offset in [0, 1, 2, 5, 6, 7, 8, 9, 20]:
+        test_db_session.add(UserStreak(user_id=user["id"], date=today - timedelta(days=offset)))
+    test_db_session.commit()
+    
+    response = client.get("/api/statistics", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 200
+    stats = response.json()
+    assert stats["currentStreak"] == 3
+    assert stats["longestStreak"] == 5
@@ -92,6 +92,27 @@ def test_add_word_persists(client, admin_token, sample_deck, test_db_session):
     assert word.deck_id == sample_deck.id
 
 
+def test_game_attempt_saved_without_unique_index(admin_user, sample_deck, sample_words, test_db_session, test_engine):
+    """Test that attempts still save on databases missing ix_attempt_session_word."""
+    from app.db.database_service import DatabaseService
+
+    index = next(i for i in GameAttempt.__table__.indexes if i.name == "ix_attempt_session_word")
+    index.drop(bind=test_engine)
+    try:
+        db = DatabaseService(test_db_session)
+        word_id = sample_words[0].id
+        session = db.create_game_session(admin_user.id, sample_deck.id, [word_id])
+        db.create_game_attempt(session["id"], word_id, True, 500)
+
+        attempts = db.get_attempts_by_session(session["id"])
+        assert len(attempts) == 1
+        assert attempts[0]["is_correct"] is True
+        assert attempts[0]["response_time"] == 500
+    finally:
+        test_db_session.rollback()
+        index.create(bind=test_engine)
+
+
 def test_game_session_persists(client, admin_token, sample_deck, sample_words, test_db_session):
     """Test that game session persists to database."""
     headers = {"Authorization": f"Bearer {admin_token}"}